@@ -21,9 +21,17 @@ __email__ = 'jaime.rvq@gmail.com'
 __status__ = 'Testing'
 
 
-import datetime
+import os
+import time
 
+import check_costs
+import frame_files
 import nuke_specifics
+import render_manifest
+import render_pool
+import run_log
+import tracing
+import write_queue
 
 # -------------------------------- CONSTANTS -------------------------------- #
 
@@ -37,15 +45,84 @@ FRAMEESTART_INFO = 6
 FRAMEEND_INFO = 7
 EXTENSION_INFO = 8
 
+IMMEDIATE_WRITE = 0
+BATCH_WRITE = 1
+PROCESS_POOL_WRITE = 2
+
+
+# -------------------------------- PROGRESS -------------------------------- #
+
+class RunCancelled(Exception):
+    pass
+
+
+class RunProgress(object):
+
+    # Receives the progress of a run (Does nothing by default, see execution_controller.ExecutionController)
+
+    # Frames the writes are executed in at a time, to report (and be able to cancel) after each slice. None executes
+    # every range at once
+    frame_slice = None
+
+    def __init__(self):
+        self.cancelled = False
+
+    def stream_started(self, stream_number, total_streams, description):
+        pass
+
+    def node_executed(self, description, node_class, node_id):
+        pass
+
+    def frames_written(self, description, first_frame, last_frame):
+        pass
+
+    def waiting(self):
+        # Called while waiting for the render processes
+        pass
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise RunCancelled()
+
 
 # -------------------------------- CLASS -------------------------------- #
 
 class AbstactStream(object):
 
-    def __init__(self, start_stream, parent_feedback_window):
+    def __init__(self, stream_plan, log, results_cache=None, batch_queue=None, resume=False,
+                 skip_unchanged=False, progress=None, full_audit=False):
+
+        # Compiled stream (See execution_plan.StreamPlan)
+        self.plan = stream_plan
+
+        # Log of the run (See run_log.RunLog)
+        self.log = log
+        self.description = stream_plan.description
+
+        # Progress of the run (Also where a cancellation is detected)
+        self.progress = progress or RunProgress()
+
+        # Full audit: every node is run, in the order of the stream. Otherwise the writing info is resolved first, and
+        # the checks are only run (cheapest first, until one fails) if the stream can be rendered
+        self.full_audit = full_audit
+        self.skipped_checks = 0
+
+        # Check results shared between all the streams of a run
+        self.results_cache = results_cache
+
+        # Batch writing (If there is no queue, the output is written as soon as the stream finishes)
+        self.batch_queue = batch_queue
 
-        # Window to output feedback
-        self.window = parent_feedback_window
+        # Resume mode (Only the frames missing on disk are written)
+        self.resume = resume
+
+        # Render cache (The streams that have not changed since their last render are not written again)
+        self.skip_unchanged = skip_unchanged
+        self.output_path = ''
+        self.output_hash = ''
+
+        # Frame ranges whose render failed (Only known when rendering in parallel processes, see write_queue)
+        self.failed_frame_ranges = []
 
         # Write infos
         self.origin_node_name = ''
@@ -67,124 +144,312 @@ class AbstactStream(object):
         self.manipulation_nodes = set()
 
         # Execute
-        if start_stream.output_stream:
-            self.execute(start_stream)
+        if stream_plan.operations:
+            self.execute()
+
+    def execute(self):
+
+        # The operations of the stream are already flattened in its plan, they are run in a loop
+        if self.plan.loops:
+            self.all_checks_good = False
+            self.append_to_log('<b>[!]</b> {} loops back on itself, it will not be run nor rendered'
+                               ''.format(self.description), run_log.ERROR)
+            return
+
+        self.append_to_log('Started execution of Stream<font size=4> ({})'.format(self.description), run_log.STREAM)
+        if self.full_audit:
+            for operation, prefix_key in zip(self.plan.operations, self.plan.prefix_keys):
+                self.execute_operation(operation, prefix_key)
+        else:
+            self.execute_cost_ordered()
 
-    def execute(self, stream):
+        self.final_checks()
 
-        if stream.parent_node.node_class == 'Start':
-            self.append_to_log('Started execution of Stream<font size=4> (Stream number: {} | From node with ID:{})'
-                               ''.format(stream.index, stream.parent_node.id), 6, 'lime')
+    def execute_cost_ordered(self):
 
-        else:
-            response = stream.parent_node.run_node()
-
-            # RESPONSE
-            response_superclass = response[0]
-            response_class = response[1]
-            response_id = response[2]
-
-            response_writing_info = response[3]
-            response_message = response[4]
-            response_completion = response[5]
-
-            if response_completion:
-                self.append_to_log('Executed node of type: {0}  (Node ID: {1})<br>Result: {2}'
-                                   ''.format(response_class, response_id, response_message), 4)    
-                
-                if response_superclass == 'WritingNodes':
-                    if response_writing_info == ORIGIN_INFO:
-                        self.origin_node_name = response_message
-                    elif response_writing_info == FILEPATH_INFO:
-                        self.file_path = response_message
-                    elif response_writing_info == COMMENT_INFO:
-                        self.comment = response_message
-                    elif response_writing_info == PADDING_INFO:
-                        self.padding = '_' + response_message
-                    elif response_writing_info == VERSION_INFO:
-                        self.version = '_' + response_message
-                    elif response_writing_info == FRAMEESTART_INFO:
-                        self.start_frame = response_message
-                    elif response_writing_info == FRAMEEND_INFO:
-                        self.end_frame = response_message
-                    elif response_writing_info == EXTENSION_INFO:
-                        self.extension = response_message
-                        
+        # Cheap nodes first (The order between checks and the rest does not change the result of the stream)
+        checks = []
+        for operation, prefix_key in zip(self.plan.operations, self.plan.prefix_keys):
+            if operation.node_superclass == 'CheckNodes':
+                checks.append((operation, prefix_key))
             else:
-                self.append_to_log('Executed node of type: {0}  (Node ID: {1})<br>Result: {2}'
-                                   ''.format(response_class, response_id, response_message), 4, 'red')
-                
-                if response_superclass == 'CheckNodes':
-                    self.all_checks_good = False
-
-            if response_superclass == 'Manipulation':
-                self.manipulation_nodes.add(response_class)
-
-        # JUMP TO NEXT STREAM
-        next_stream = stream.output_stream
-        if next_stream:
-            self.execute(next_stream)
+                self.execute_operation(operation, prefix_key)
+
+        if not checks:
+            return
+
+        if not self.can_be_written():
+            self.skipped_checks = len(checks)
+            self.append_to_log('This stream can not be rendered, its {} check nodes have been skipped (Run in full '
+                               'audit mode to run them anyway)'.format(len(checks)), run_log.WARNING)
+            return
+
+        # Cheapest checks first, measured in previous runs
+        checks.sort(key=lambda check: check_costs.COSTS.estimate(check[0].node_class, check[0].value))
+        for i, (operation, prefix_key) in enumerate(checks):
+            self.execute_operation(operation, prefix_key)
+
+            if not self.all_checks_good and i + 1 < len(checks):
+                self.skipped_checks = len(checks) - i - 1
+                self.append_to_log('A check node has failed, the other {} check nodes of this stream have been '
+                                   'skipped (Run in full audit mode to run them anyway)'.format(self.skipped_checks),
+                                   run_log.WARNING)
+                return
+
+    def can_be_written(self):
+        return bool(self.origin_node_name and self.file_path and self.comment and self.start_frame is not None and
+                    self.end_frame is not None and self.extension)
+
+    def execute_operation(self, operation, prefix_key=None):
+
+        with tracing.span(operation.node_class, 'node', id=operation.id, stream=self.description):
+            response, cached = self.run_stream_node(operation, prefix_key)
+        cached_text = ' (cached)' if cached else ''
+
+        # RESPONSE
+        response_superclass = response[0]
+        response_class = response[1]
+        response_id = response[2]
+
+        response_writing_info = response[3]
+        response_message = response[4]
+        response_completion = response[5]
+
+        if response_completion:
+            self.append_to_log('Executed node of type: {0}  (Node ID: {1})<br>Result{2}: {3}'
+                               ''.format(response_class, response_id, cached_text, response_message), run_log.INFO,
+                               response_class, response_id)
+            
+            if response_superclass == 'WritingNodes':
+                if response_writing_info == ORIGIN_INFO:
+                    self.origin_node_name = response_message
+                elif response_writing_info == FILEPATH_INFO:
+                    self.file_path = response_message
+                elif response_writing_info == COMMENT_INFO:
+                    self.comment = response_message
+                elif response_writing_info == PADDING_INFO:
+                    self.padding = '_' + response_message
+                elif response_writing_info == VERSION_INFO:
+                    self.version = '_' + response_message
+                elif response_writing_info == FRAMEESTART_INFO:
+                    self.start_frame = response_message
+                elif response_writing_info == FRAMEEND_INFO:
+                    self.end_frame = response_message
+                elif response_writing_info == EXTENSION_INFO:
+                    self.extension = response_message
+                    
+        else:
+            self.append_to_log('Executed node of type: {0}  (Node ID: {1})<br>Result{2}: {3}'
+                               ''.format(response_class, response_id, cached_text, response_message), run_log.ERROR,
+                               response_class, response_id)
+            
+            if response_superclass == 'CheckNodes':
+                self.all_checks_good = False
+
+        if response_superclass == 'Manipulation':
+            self.manipulation_nodes.add(response_class)
+
+        self.progress.node_executed(self.description, response_class, response_id)
+        self.progress.check_cancelled()
+
+    def run_stream_node(self, operation, prefix_key=None):
+        if self.results_cache is None:
+            return operation.run_node(), False
+
+        # Checks depend only on their widget value and the scene: shared by all the streams, and logged as cached
+        if operation.node_superclass == 'CheckNodes':
+            key = (operation.node_class, operation.get_widget_value(), nuke_specifics.scene_revision())
+            shown_as_cached = True
+
+        # Any other node is shared along the prefix that the streams have in common (See the plan trie)
+        elif prefix_key is not None:
+            key = prefix_key
+            shown_as_cached = False
+
         else:
-            self.final_checks()
+            return operation.run_node(), False
+
+        if key in self.results_cache:
+            cached_response = self.results_cache[key]
+            return cached_response[:2] + [operation.id] + cached_response[3:], shown_as_cached
+
+        start_time = time.time()
+        response = operation.run_node()
+        if operation.node_superclass == 'CheckNodes':
+            check_costs.COSTS.record(operation.node_class, operation.value, time.time() - start_time)
+        self.results_cache[key] = response
+
+        return response, False
+
+    def append_to_log(self, message, level=run_log.INFO, node_class=None, node_id=None):
+        self.log.log(message, level, self.description, node_class, node_id)
 
-    def append_to_log(self, message, size, color='white'):
-        time = datetime.datetime.now()
-        formatted_time = time.strftime('%Y-%m-%d %H:%M:%S')
-        self.window.insertHtml("<font color='{0}' size={1}>[{2}] {3}<br>".format(color, size, formatted_time, message))
+    def frames_written(self, first_frame, last_frame):
+        self.progress.frames_written(self.description, first_frame, last_frame)
+        self.progress.check_cancelled()
+
+    def frames_failed(self, first_frame, last_frame):
+        self.failed_frame_ranges.append((first_frame, last_frame))
+
+    @property
+    def render_failed(self):
+        return bool(self.failed_frame_ranges)
 
     def final_checks(self):
 
         # Check for all the elements needed for rendering
         if not self.origin_node_name:
             self.all_write_fields = False
-            self.append_to_log('There was no origin node detected in this stream', 4, 'orange')
+            self.append_to_log('There was no origin node detected in this stream', run_log.WARNING)
 
         if not self.file_path:
             self.all_write_fields = False
-            self.append_to_log('There was no filepath detected in this stream', 4, 'orange')
+            self.append_to_log('There was no filepath detected in this stream', run_log.WARNING)
 
         if not self.comment:
             self.all_write_fields = False
-            self.append_to_log('There was no comment detected in this stream', 4, 'orange')
+            self.append_to_log('There was no comment detected in this stream', run_log.WARNING)
 
         if self.start_frame is None:
             self.all_write_fields = False
-            self.append_to_log('There was no start frame detected in this stream', 4, 'orange')
+            self.append_to_log('There was no start frame detected in this stream', run_log.WARNING)
 
         if self.end_frame is None:
             self.all_write_fields = False
-            self.append_to_log('There was no end frame detected in this stream', 4, 'orange')
+            self.append_to_log('There was no end frame detected in this stream', run_log.WARNING)
 
         if not self.extension:
             self.all_write_fields = False
-            self.append_to_log('There was no valid file extension detected in this stream', 4, 'orange')
+            self.append_to_log('There was no valid file extension detected in this stream', run_log.WARNING)
 
 
         # Warning that the stream cannot render
         if not self.all_checks_good:
             self.append_to_log('<b>[!]</b> Some of the check nodes in the stream have failed, it will not be rendered',
-                               4, 'red')
+                               run_log.ERROR)
         if not self.all_write_fields:
             self.append_to_log('<b>[!]</b> Some of the elements needed for rendering have not been found. Please note '
                                'that this stream and its checks have been run but it will not have a rendered output',
-                               4, 'red')
+                               run_log.ERROR)
 
         # Send to be written if all info needed is present
         if self.all_checks_good and self.all_write_fields:
             self.send_to_write()
 
-        self.append_to_log('Finished execution of stream<br>', 5, 'lime')
+        self.append_to_log('Finished execution of stream<br>', run_log.STREAM)
 
     def send_to_write(self):
-        self.append_to_log('Starting to write the output for this stream', 4, 'magenta')
 
         # Correct format for paths
         path = self.file_path.replace('\\', '/')
         path = path + '/' if not path.endswith('/') else path
         complete_file_value = path + self.comment + self.padding + self.version + self.extension
 
-        # Send to write
-        nuke_specifics.write_path(self.origin_node_name, complete_file_value,
-                                  self.start_frame, self.end_frame, self.manipulation_nodes)
+        self.output_path = complete_file_value
+
+        # The upstream tree is only described and hashed for the render cache
+        if self.skip_unchanged:
+            self.output_hash = render_manifest.stream_hash(nuke_specifics.upstream_state(self.origin_node_name),
+                                                           self.manipulation_nodes, self.start_frame, self.end_frame,
+                                                           complete_file_value)
+
+        missing_frames = None
+        if self.resume or self.skip_unchanged:
+            missing_frames = frame_files.missing_frames(complete_file_value, self.start_frame, self.end_frame)
+
+        # Render cache (Skip the whole stream if nothing changed and its files are intact)
+        resume = self.resume
+        if self.skip_unchanged:
+            manifest = render_manifest.RenderManifest(os.path.dirname(complete_file_value))
+            if not manifest.is_current(complete_file_value, self.output_hash):
+                # The frames on disk belong to another state of the scene: all of them are rendered again, so the
+                # hash recorded afterwards describes the whole sequence
+                if resume:
+                    self.append_to_log('The output for this stream has changed since it was last rendered, all its '
+                                       'frames will be rendered again', run_log.WRITE)
+                resume = False
+            elif not missing_frames:
+                self.append_to_log('The output for this stream has not changed since it was last rendered, '
+                                   'it will not be written again', run_log.WRITE)
+                return
+
+        # Resume (Skip the frames already rendered)
+        frame_ranges = None
+        if resume:
+            total_frames = max(self.end_frame - self.start_frame + 1, 0)
+            self.append_to_log('Resuming the output for this stream: {} frames already rendered will be skipped, {} '
+                               'frames will be rendered'.format(total_frames - len(missing_frames), len(missing_frames)),
+                               run_log.WRITE)
+            if not missing_frames:
+                return
+
+            frame_ranges = frame_files.contiguous_ranges(missing_frames)
+
+        # Queue for batch writing
+        if self.batch_queue is not None:
+            self.batch_queue.add(write_queue.WriteJob(self, self.origin_node_name, complete_file_value,
+                                                      self.start_frame, self.end_frame, self.manipulation_nodes,
+                                                      frame_ranges))
+            self.append_to_log('The output for this stream has been queued for batch writing', run_log.WRITE)
+            return
 
-        self.append_to_log('Finished writing the output for this stream', 4, 'magenta')
\ No newline at end of file
+        # Send to write
+        self.append_to_log('Starting to write the output for this stream', run_log.WRITE)
+        on_frames = self.frames_written if self.progress.frame_slice else None
+        nuke_specifics.write_path(self.origin_node_name, complete_file_value, self.start_frame, self.end_frame,
+                                  self.manipulation_nodes, frame_ranges, on_frames, self.progress.frame_slice)
+
+        self.append_to_log('Finished writing the output for this stream', run_log.WRITE)
+        self.output_written()
+
+    def output_written(self):
+        # Recorded in the manifest of the output directory, for the render cache of later runs (Only runs that skip
+        # unchanged streams hash their outputs, the others just drop any previous entry)
+        try:
+            manifest = render_manifest.RenderManifest(os.path.dirname(self.output_path))
+            if self.output_hash:
+                manifest.record(self.output_path, self.output_hash, self.origin_node_name, self.manipulation_nodes,
+                                self.start_frame, self.end_frame)
+            else:
+                manifest.forget(self.output_path)
+        except (IOError, OSError) as e:
+            self.append_to_log('The render manifest could not be updated: {}'.format(e), run_log.WARNING)
+
+
+# -------------------------------- RUNS -------------------------------- #
+
+def run_plan(plan, log, write_mode=IMMEDIATE_WRITE, workers=None, resume=False, skip_unchanged=False,
+             progress=None, full_audit=False):
+
+    # A cancellation (RunCancelled) stops the run after the current node or frame, the cleanup is always done
+    progress = progress or RunProgress()
+
+    # One single pass through the scene, shared by all the checks of this run
+    nuke_specifics.build_scene_snapshot()
+    results_cache = {}
+
+    # Manipulation chains and writes are reused during the run, and all deleted together at the end
+    nuke_specifics.open_manipulation_pool()
+    batch_queue = None
+    if write_mode == BATCH_WRITE:
+        batch_queue = write_queue.WriteQueue()
+    elif write_mode == PROCESS_POOL_WRITE:
+        batch_queue = write_queue.WriteQueue(render_pool.ProcessPoolRenderer(workers))
+
+    executed_streams = []
+    try:
+        for stream_number, stream_plan in enumerate(plan.streams, 1):
+            progress.stream_started(stream_number, len(plan.streams), stream_plan.description)
+            with tracing.span(stream_plan.description, 'stream'):
+                executed_streams.append(AbstactStream(stream_plan, log, results_cache, batch_queue,
+                                                      resume, skip_unchanged, progress, full_audit))
+
+        if batch_queue is not None:
+            with tracing.span('submit', 'write', jobs=len(batch_queue.jobs)):
+                batch_queue.submit(progress)
+    finally:
+        nuke_specifics.close_manipulation_pool()
+        nuke_specifics.clear_scene_snapshot()
+        log.flush()
+
+    return executed_streams
@@ -0,0 +1,133 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: batch_runner.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Headless runner for saved networks (No Qt needed, so it can run on render nodes with no display)
+
+    nuke -t batch_runner.py network.jsonl script.nk [--report report.json] [--write-mode immediate|batch|pool]
+                                                     [--workers N] [--resume] [--skip-unchanged] [--full-audit]
+                                                     [--trace trace.json] [--log-jsonl log.jsonl]
+
+    Exit code: 0 if every stream passed its checks, 1 if any check failed
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import argparse
+import json
+import sys
+
+import nuke
+
+import abstract_stream
+import network_format
+import run_log
+import tracing
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+WRITE_MODES = {'immediate': abstract_stream.IMMEDIATE_WRITE,
+               'batch': abstract_stream.BATCH_WRITE,
+               'pool': abstract_stream.PROCESS_POOL_WRITE}
+
+
+# -------------------------------- RUN -------------------------------- #
+
+def load_network(network_file):
+    return network_format.load_graph(network_file)
+
+def run_network(graph, log, write_mode=abstract_stream.IMMEDIATE_WRITE, workers=None, resume=False,
+                skip_unchanged=False, full_audit=False):
+    executed_streams = graph.run(log, write_mode, workers, resume, skip_unchanged, full_audit=full_audit)
+
+    streams_report = []
+    for executed_stream in executed_streams:
+        if not executed_stream.plan.operations:
+            continue
+
+        streams_report.append({'stream': executed_stream.description,
+                               'start_node_id': executed_stream.plan.start_node_id,
+                               'stream_index': executed_stream.plan.stream_index,
+                               'checks_passed': executed_stream.all_checks_good,
+                               'checks_skipped': executed_stream.skipped_checks,
+                               'write_fields_complete': executed_stream.all_write_fields,
+                               'output_path': executed_stream.output_path,
+                               'failed_frames': [list(frame_range) for frame_range
+                                                 in sorted(executed_stream.failed_frame_ranges)]})
+
+    return streams_report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Runs all the streams of a saved network on a Nuke script')
+    parser.add_argument('network', help='Network file saved from the Scene checks widget')
+    parser.add_argument('script', help='Nuke script to run the network on')
+    parser.add_argument('--report', help='File to write the JSON report to (Default: standard output)')
+    parser.add_argument('--write-mode', choices=sorted(WRITE_MODES), default='immediate')
+    parser.add_argument('--workers', type=int, default=None, help='Processes for the "pool" write mode')
+    parser.add_argument('--resume', action='store_true', help='Only render the frames missing on disk')
+    parser.add_argument('--skip-unchanged', action='store_true', help='Skip the streams not changed since last render')
+    parser.add_argument('--full-audit', action='store_true', help='Run every check, even if the stream can not render')
+    parser.add_argument('--log-jsonl', help='File to write the log records to, one JSON object per line')
+    parser.add_argument('--trace', help='File to write the Chrome trace of the run to (Timings also in the report)')
+    args = parser.parse_args(argv)
+
+    graph = load_network(args.network)
+    nuke.scriptOpen(args.script)
+
+    memory_sink = run_log.MemorySink()
+    log = run_log.RunLog([memory_sink])
+    if args.report:
+        log.add_sink(run_log.PrintSink())
+    if args.log_jsonl:
+        log.add_sink(run_log.JsonlSink(args.log_jsonl))
+    if args.trace:
+        tracing.TRACER.start()
+
+    try:
+        streams_report = run_network(graph, log, WRITE_MODES[args.write_mode], args.workers, args.resume,
+                                     args.skip_unchanged, args.full_audit)
+    finally:
+        log.close()
+        if args.trace:
+            tracing.TRACER.stop()
+            tracing.TRACER.export_chrome_trace(args.trace)
+            sys.stderr.write(tracing.TRACER.summary_table() + '\n')
+
+    failed_streams = [stream for stream in streams_report if not stream['checks_passed'] or stream['failed_frames']]
+    report = {'network': args.network,
+              'script': args.script,
+              'streams': streams_report,
+              'failed_streams': len(failed_streams),
+              'log': memory_sink.lines}
+
+    if args.trace:
+        report['timings'] = [{'category': category, 'name': name, 'count': count, 'total': total, 'mean': mean,
+                              'max': maximum}
+                             for category, name, count, total, mean, maximum in tracing.TRACER.summary()]
+
+    if args.report:
+        with open(args.report, 'w') as w:
+            json.dump(report, w, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    return 1 if failed_streams else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: bench_building.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Building of networks of 10k nodes from a script, on the headless data model. Before: nodes added and connected
+       one by one, with the chains updated on every connection. After: GraphBuilder, one batch for the whole network
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import bench_utils
+
+import graph_model
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+NODE_COUNT = 10000
+
+# Streams of the networks built, as (number of streams, nodes per stream)
+SHAPES = [(100, NODE_COUNT // 100), (10, NODE_COUNT // 10)]
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def build_one_by_one(stream_count, stream_length):
+    # Before
+    graph = graph_model.GraphModel()
+    for i in range(stream_count):
+        previous = graph.add_node('Start')
+        for j in range(stream_length - 1):
+            node = graph.add_node('Comment', value='comment_{}'.format(j), x=(j + 1) * 200, y=i * 100)
+            graph.connect(previous.streams[0], node.streams[0])
+            previous = node
+
+    return graph
+
+def build_in_bulk(stream_count, stream_length):
+    # After
+    graph = graph_model.GraphModel()
+    builder = graph.builder()
+    for i in range(stream_count):
+        keys = [builder.add_node('Start')]
+        keys += [builder.add_node('Comment', value='comment_{}'.format(j), x=(j + 1) * 200, y=i * 100)
+                 for j in range(stream_length - 1)]
+        builder.chain(keys)
+    builder.build()
+
+    return graph
+
+
+# -------------------------------- MAIN -------------------------------- #
+
+def main():
+    for stream_count, stream_length in SHAPES:
+        title = 'Build {} nodes ({} streams of {} nodes)'.format(stream_count * stream_length, stream_count,
+                                                                stream_length)
+        before = bench_utils.best_time(lambda: build_one_by_one(stream_count, stream_length), repeat=1)
+        bench_utils.report(title, before, bench_utils.best_time(lambda: build_in_bulk(stream_count, stream_length)))
+
+
+if __name__ == '__main__':
+    main()
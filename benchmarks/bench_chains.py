@@ -0,0 +1,95 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: bench_chains.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Long streams (Chains of 10k nodes). Before: the stream is followed recursively, one Python frame per node (As
+       AbstactStream.execute did). After: the stream is flattened once (ModelStream.chain) and run in a loop
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import sys
+
+import bench_utils
+
+import graph_model
+import run_log
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+SHORT_CHAIN = 900  # Under the default recursion limit
+LONG_CHAIN = 10000
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def chain_graph(node_count):
+    graph = graph_model.GraphModel()
+    builder = graph.builder()
+    keys = [builder.add_node('Start')]
+    keys += [builder.add_node('Comment', value='comment_{}'.format(i)) for i in range(node_count)]
+    builder.chain(keys)
+    builder.build()
+
+    return graph
+
+def run_recursively(stream):
+    # Before
+    if stream.parent_class != 'Start':
+        stream.parent_node.run_node()
+
+    if stream.output_stream:
+        run_recursively(stream.output_stream)
+
+def run_iteratively(stream):
+    # After
+    streams, loops = stream.chain()
+    for chained_stream in streams[1:]:
+        chained_stream.parent_node.run_node()
+
+def recursion_failure(stream):
+    try:
+        run_recursively(stream)
+    except RuntimeError as e:
+        # RecursionError in Python 3
+        return '{} (Recursion limit: {})'.format(type(e).__name__, sys.getrecursionlimit())
+
+    return 'No error'
+
+
+# -------------------------------- MAIN -------------------------------- #
+
+def main():
+    short_stream = chain_graph(SHORT_CHAIN).start_streams()[0]
+    bench_utils.report('Run a stream of {} nodes'.format(SHORT_CHAIN),
+                       bench_utils.best_time(lambda: run_recursively(short_stream)),
+                       bench_utils.best_time(lambda: run_iteratively(short_stream)))
+
+    long_graph = chain_graph(LONG_CHAIN)
+    long_stream = long_graph.start_streams()[0]
+    bench_utils.report('Run a stream of {} nodes'.format(LONG_CHAIN),
+                       recursion_failure(long_stream),
+                       bench_utils.best_time(lambda: run_iteratively(long_stream)))
+
+    # The whole run of the network (Plan compilation, execution and log), only possible after
+    full_run = bench_utils.best_time(lambda: long_graph.run(run_log.RunLog()),
+                                     setup=lambda: setattr(long_graph, 'plan', None))
+    print('Full run of the network of {} nodes (Plan, execution and log): {:.4f} s'.format(LONG_CHAIN, full_run))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: bench_loading.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Loading of a saved network of 5,000 nodes, on the headless data model. Before: every node is added, and then
+       both ends of every connection are searched among all the nodes (to_stream), and the chains updated on every
+       connection (As CustomScene.load_from_file did). After: bulk loading, with the nodes indexed by (class, id)
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import json
+import os
+import shutil
+import tempfile
+
+import bench_utils
+
+import graph_model
+import network_format
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+STREAM_COUNT = 50
+CHAIN_LENGTH = 99  # Nodes after every Start node (5,000 nodes in total)
+
+FILE_NAMES = ['network.json', 'network.jsonl', 'network.jsonl.gz']
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def network_graph():
+    graph = graph_model.GraphModel()
+    builder = graph.builder()
+    for i in range(STREAM_COUNT):
+        keys = [builder.add_node('Start', x=0, y=i * 100)]
+        keys += [builder.add_node('Comment', value='comment_{}'.format(j), x=(j + 1) * 200, y=i * 100)
+                 for j in range(CHAIN_LENGTH)]
+        builder.chain(keys)
+    builder.build()
+
+    return graph
+
+def load_linearly(net_dict):
+    # Before
+    graph = graph_model.GraphModel()
+    for n in net_dict:
+        node = net_dict[n]
+        graph.add_node(node['class'], node['id'], node['widget_value'], node['stream_count'], node['x_pos'],
+                       node['y_pos'])
+
+    for n in net_dict:
+        for index in net_dict[n]['streams']:
+            target = net_dict[n]['streams'][index]
+            origin_stream = graph.to_stream(net_dict[n]['class'], net_dict[n]['id'], int(index))
+            target_stream = graph.to_stream(target[0], target[1], target[2])
+            graph.connect(origin_stream, target_stream)
+
+    return graph
+
+
+# -------------------------------- MAIN -------------------------------- #
+
+def main():
+    graph = network_graph()
+    net_dict = graph.to_dict()
+
+    directory = tempfile.mkdtemp()
+    try:
+        legacy_path = os.path.join(directory, 'legacy.json')
+        network_format.write_network(graph, legacy_path)
+
+        def load_legacy_file():
+            with open(legacy_path, 'r') as r:
+                load_linearly(json.load(r))
+
+        # The only format before was the legacy one
+        before = bench_utils.best_time(load_legacy_file, repeat=1)
+        for file_name in FILE_NAMES:
+            path = os.path.join(directory, file_name)
+            network_format.write_network(graph, path)
+            title = 'Load a network of {} nodes ({}, {:.0f} KB)'.format(len(graph.nodes), file_name,
+                                                                        os.path.getsize(path) / 1024.0)
+            bench_utils.report(title, before, bench_utils.best_time(lambda: network_format.load_graph(path)))
+
+        # Only the building of the graph, once the file is read
+        bench_utils.report('Build a network of {} nodes from its saved dict'.format(len(graph.nodes)),
+                           bench_utils.best_time(lambda: load_linearly(net_dict), repeat=1),
+                           bench_utils.best_time(lambda: graph_model.GraphModel.from_dict(net_dict)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: bench_pan_zoom.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Frame time of a scripted pan and zoom over a network of 2,000 nodes. Before: every node is drawn in detail, with
+       all its widgets and no paint cache. After: level of detail, widgets created as the nodes come into view, and
+       cached painting. Needs PySide2 (Inside Nuke, or with PySide2 installed, where it runs on the offscreen platform)
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import os
+import timeit
+
+import bench_utils
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PySide2 import QtWidgets
+
+import custom_widgets
+import node_classes
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+STREAM_COUNT = 40
+CHAIN_LENGTH = 49  # Nodes after every Start node (2,000 nodes in total)
+
+VIEW_SIZE = (1600, 900)
+
+ZOOM_STEPS = 15
+ZOOM_FACTOR = 1.2
+PAN_STEPS = 30
+PAN_STEP = 120  # Pixels
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def network_view():
+    scene = custom_widgets.CustomScene()
+    scene.setSceneRect(-20000, -20000, 20000, 20000)
+
+    view = custom_widgets.CustomGW()
+    view.setScene(scene)
+    scene.setParent(view)
+    view.resize(*VIEW_SIZE)
+
+    builder = scene.builder()
+    for i in range(STREAM_COUNT):
+        keys = [builder.add_node('Start', x=-18000, y=-18000 + i * 160)]
+        keys += [builder.add_node('Comment', value='comment_{}'.format(j), x=-18000 + (j + 1) * 260,
+                                  y=-18000 + i * 160) for j in range(CHAIN_LENGTH)]
+        builder.chain(keys)
+    builder.build()
+
+    view.show()
+    QtWidgets.QApplication.processEvents()
+
+    return scene, view
+
+def draw_everything(scene):
+    # Before: no level of detail, every widget created up front and no paint cache
+    node_classes.DETAIL_MIN_ZOOM = 0.0
+    for node in scene.all_nodes:
+        node.set_detailed(True)
+        node.setCacheMode(QtWidgets.QGraphicsItem.NoCache)
+        for stream in node.streams:
+            stream.setCacheMode(QtWidgets.QGraphicsItem.NoCache)
+
+def frame_times(scene, view, level_of_detail):
+    # Zoom in from the whole network to 100%, then pan across it, and zoom out again. Every step is one frame: the
+    # level of detail (Normally updated by a timer, a moment after the view changes) and a full repaint of the view
+    steps = [lambda: view.scale(ZOOM_FACTOR, ZOOM_FACTOR)] * ZOOM_STEPS
+    steps += [lambda: view.translate(-PAN_STEP, -PAN_STEP / 2)] * PAN_STEPS
+    steps += [lambda: view.scale(1 / ZOOM_FACTOR, 1 / ZOOM_FACTOR)] * ZOOM_STEPS
+
+    view.resetTransform()
+    view.scale(ZOOM_FACTOR ** -ZOOM_STEPS, ZOOM_FACTOR ** -ZOOM_STEPS)
+    view.centerOn(scene.itemsBoundingRect().center())
+    QtWidgets.QApplication.processEvents()
+
+    times = []
+    for step in steps:
+        start = timeit.default_timer()
+        step()
+        if level_of_detail:
+            scene.update_level_of_detail()
+        view.viewport().repaint()
+        QtWidgets.QApplication.processEvents()
+        times.append(timeit.default_timer() - start)
+
+    return times
+
+
+# -------------------------------- MAIN -------------------------------- #
+
+def main():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    scene, view = network_view()
+    after = frame_times(scene, view, level_of_detail=True)
+    view.close()
+
+    detail_min_zoom = node_classes.DETAIL_MIN_ZOOM
+    scene, view = network_view()
+    draw_everything(scene)
+    try:
+        before = frame_times(scene, view, level_of_detail=False)
+    finally:
+        node_classes.DETAIL_MIN_ZOOM = detail_min_zoom
+        view.close()
+
+    title = 'Pan and zoom over a network of {} nodes ({} frames)'.format(len(scene.all_nodes), len(after))
+    bench_utils.report(title + ', mean frame time', 1000.0 * sum(before) / len(before),
+                       1000.0 * sum(after) / len(after), unit='ms')
+    bench_utils.report(title + ', worst frame time', 1000.0 * max(before), 1000.0 * max(after), unit='ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: bench_utils.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Shared setup of the benchmarks: the modules are imported by their plain names, and outside of Nuke the in-memory
+       fake_nuke of the tests is used as the nuke module. Run any benchmark from the root of the repo, i.e.:
+           python benchmarks/bench_chains.py >> bench_output.txt
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import os
+import sys
+import timeit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+try:
+    import nuke
+except ImportError:
+    sys.path.insert(0, os.path.join(ROOT_DIR, 'tests'))
+    import fake_nuke
+    sys.modules['nuke'] = fake_nuke
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+REPEAT = 3
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def best_time(function, setup=None, repeat=REPEAT):
+    # Best of several runs, in seconds (setup, if any, is run before every run and not timed)
+    times = []
+    for i in range(repeat):
+        if setup is not None:
+            setup()
+        start = timeit.default_timer()
+        function()
+        times.append(timeit.default_timer() - start)
+
+    return min(times)
+
+def report(title, before, after, unit='s'):
+    # before and after are a number (of the unit given) or a text, i.e. for a failure
+    def formatted(value):
+        return '{:.4f} {}'.format(value, unit) if isinstance(value, (int, float)) else value
+
+    print(title)
+    print('    before: {}'.format(formatted(before)))
+    print('    after:  {}'.format(formatted(after)))
+    if isinstance(before, (int, float)) and isinstance(after, (int, float)) and after > 0:
+        print('    speedup: {:.1f}x'.format(before / after))
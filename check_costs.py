@@ -0,0 +1,51 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: check_costs.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Durations of the check nodes measured in the previous runs of the session, to run the cheapest checks first
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+# Weight of the last measure in the moving average
+SMOOTHING = 0.3
+
+
+# -------------------------------- CLASS -------------------------------- #
+
+class CheckCosts(object):
+
+    def __init__(self, smoothing=SMOOTHING):
+        self.smoothing = smoothing
+        self.durations = {}
+
+    def record(self, node_class, value, seconds):
+        key = (node_class, value)
+        if key not in self.durations:
+            self.durations[key] = seconds
+        else:
+            self.durations[key] += self.smoothing * (seconds - self.durations[key])
+
+    def estimate(self, node_class, value):
+        # Checks never measured go first, so that they get a measure
+        return self.durations.get((node_class, value), 0.0)
+
+
+# Shared by all the runs of the session
+COSTS = CheckCosts()
@@ -22,11 +22,21 @@ __status__ = 'Testing'
 
 from PySide2 import QtWidgets, QtCore, QtGui
 import random
-import json
 
+import graph_model
+import network_format
 import node_classes
 
 
+# -------------------------------- CONSTANTS -------------------------------- #
+
+NETWORK_SAVE_FILTERS = 'Compressed network (*.jsonl.gz);;Network (*.jsonl);;Legacy network (*.json)'
+NETWORK_OPEN_FILTER = 'Networks (*.jsonl.gz *.jsonl *.json)'
+
+LEVEL_OF_DETAIL_DELAY = 50  # Milliseconds
+LINES_REDRAW_INTERVAL = 16  # Milliseconds (About once per frame)
+
+
 # -------------------------------- CUSTOM GRAPHICS VIEW -------------------------------- #
 
 class CustomGW(QtWidgets.QGraphicsView):
@@ -42,8 +52,24 @@ class CustomGW(QtWidgets.QGraphicsView):
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QtWidgets.QGraphicsView.NoAnchor)
 
+        # Several nodes can be selected (and moved together) by dragging a rectangle around them
+        self.setDragMode(QtWidgets.QGraphicsView.RubberBandDrag)
+
         self.middle_pressed = False
 
+    def view_changed(self):
+        # The nodes that come into view get their details (See CustomScene.update_level_of_detail)
+        if self.scene() is not None:
+            self.scene().schedule_level_of_detail()
+
+    def scrollContentsBy(self, dx, dy):
+        QtWidgets.QGraphicsView.scrollContentsBy(self, dx, dy)
+        self.view_changed()
+
+    def resizeEvent(self, event):
+        QtWidgets.QGraphicsView.resizeEvent(self, event)
+        self.view_changed()
+
     def mousePressEvent(self, event):
         self.middle_pressed = False
 
@@ -61,6 +87,7 @@ class CustomGW(QtWidgets.QGraphicsView):
             disp = new_pos - self._dragPos
             self._dragPos = new_pos
             self.translate(disp.x(), disp.y())
+            self.view_changed()
 
         QtWidgets.QGraphicsView.mouseMoveEvent(self, event)
 
@@ -84,6 +111,7 @@ class CustomGW(QtWidgets.QGraphicsView):
         new_pos = self.mapToScene(event.pos())
         disp = new_pos - old_pos
         self.translate(disp.x(), disp.y())
+        self.view_changed()
 
 
 # -------------------------------- CUSTOM SCENE CLASS -------------------------------- #
@@ -92,6 +120,9 @@ class CustomScene(QtWidgets.QGraphicsScene):
     def __init__(self):
         QtWidgets.QGraphicsScene.__init__(self)
 
+        # DATA MODEL (The nodes of the scene are views of its records)
+        self.model = graph_model.GraphModel()
+
         # NODES
         self.all_nodes = []
         self.selected_node = None
@@ -106,106 +137,123 @@ class CustomScene(QtWidgets.QGraphicsScene):
         self.testing_origin_connector = None
         self.testing_target_connector = None
 
+        # LEVEL OF DETAIL (Updated a moment after the view changes, not on every single step of a pan or a zoom)
+        self.lod_timer = QtCore.QTimer(self)
+        self.lod_timer.setInterval(LEVEL_OF_DETAIL_DELAY)
+        self.lod_timer.setSingleShot(True)
+        self.lod_timer.timeout.connect(self.update_level_of_detail)
+
+        # LINES (Nodes moved since the last redraw of their lines)
+        self.moved_nodes = set()
+        self.lines_timer = QtCore.QTimer(self)
+        self.lines_timer.setInterval(LINES_REDRAW_INTERVAL)
+        self.lines_timer.setSingleShot(True)
+        self.lines_timer.timeout.connect(self.flush_lines)
+
     def add_node(self, node_class, x, y):
-        for c in node_classes.ALL_NODES_LIST:
-            if node_class == c.node_class_nice_name or node_class == c.node_class:
-                new_node = c()
-                self.addItem(new_node)
-                new_node.setPos(x, y)
-                new_node.set_selected(False)
-                self.all_nodes.append(new_node)
+        c = node_classes.NODES_BY_CLASS.get(node_class) or node_classes.NODES_BY_NICE_NAME.get(node_class)
+        if c is None:
+            return None
+
+        new_node = c()
+        self.addItem(new_node)
+        new_node.setPos(x, y)
+        new_node.set_selected(False)
+        self.all_nodes.append(new_node)
+        self.model.register_node(new_node.model)
+        self.schedule_level_of_detail()
 
-                return new_node
+        return new_node
 
     def delete_node(self):
+        # Streams connected to the node (Their chains are the only ones to repaint)
+        neighbour_streams = []
         for stream in self.selected_node.streams:
+            neighbour_streams += [s for s in (stream.input_stream, stream.output_stream) if s is not None]
             stream.clear_connections()
 
+        self.moved_nodes.discard(self.selected_node)
         self.removeItem(self.selected_node)
         self.all_nodes.remove(self.selected_node)
+        self.model.remove_node(self.selected_node.model)
         del self.selected_node
 
-        self.color_streams(recolor=False, only_starts=False)
+        for stream in neighbour_streams:
+            self.reset_chain_color(stream)
 
     def establish_selected_node(self, node):
-        if node:
-            self.selected_node = node
-            node.set_selected(True)
-        else:
-            self.selected_node = None
-
-        for n in self.all_nodes:
-            if n != self.selected_node:
-                n.set_selected(False)
+        # Node the hotkeys act on (The selection itself, that may have more nodes moved together, is left to Qt)
+        self.selected_node = node
+        if node is None:
+            self.clearSelection()
+
+    # ------- LINES ------- #
+    def lines_changed(self, node):
+        self.moved_nodes.add(node)
+        if not self.lines_timer.isActive():
+            self.lines_timer.start()
+
+    def flush_lines(self):
+        # Every line once, even if both of its nodes moved
+        self.lines_timer.stop()
+        lines = {}
+        for node in self.moved_nodes:
+            for line, output_connector, input_connector in node.connection_lines():
+                lines[line] = (output_connector, input_connector)
+        self.moved_nodes = set()
+
+        for line, (output_connector, input_connector) in lines.items():
+            line.setPath(node_classes.connection_path(output_connector.center_point, input_connector.center_point))
 
     def to_stream(self, node_class, node_id, stream_index):
-        for node in self.all_nodes:
-            if node.node_class == node_class and node.id == node_id:
-                for stream in node.streams:
-                    if stream.index == stream_index:
-                        return stream
-
-        return None
+        model_stream = self.model.to_stream(node_class, node_id, stream_index)
+        return model_stream.view if model_stream is not None else None
 
-    def draw_valid_line(self, p1, p2):
-        new_path = QtGui.QPainterPath(p1)
+    def valid_line(self, p1, p2):
+        new_valid_line = QtWidgets.QGraphicsPathItem(node_classes.connection_path(p1, p2))
+        new_valid_line.setPen(QtGui.QPen(QtGui.QColor(QtCore.Qt.green), 2))
+        new_valid_line.setZValue(-1)
 
-        c_p1 = QtCore.QPoint(((p2.x() + p1.x()) / 2) + 10, p1.y())
-        c_p2 = QtCore.QPoint(((p2.x() + p1.x()) / 2) - 10, p2.y())
-        new_path.cubicTo(c_p1, c_p2, p2)
+        return new_valid_line
 
-        new_valid_line = QtWidgets.QGraphicsPathItem(new_path)
-        new_valid_line.setPen(QtGui.QPen(QtGui.QColor(QtCore.Qt.green), 2))
+    def draw_valid_line(self, p1, p2):
+        new_valid_line = self.valid_line(p1, p2)
         self.addItem(new_valid_line)
-        new_valid_line.setZValue(-1)
 
         return new_valid_line
 
     def color_streams(self, recolor=True, only_starts=True):
-        checkable_nodes = [n for n in self.all_nodes if n.node_class == 'Start']
-        if not only_starts:
-            checkable_nodes = self.all_nodes
-
-        for node in checkable_nodes:
-            for stream in node.streams:
-                new_pen = QtGui.QPen(QtGui.QColor(QtCore.Qt.green), 2)
-                if recolor:
-                    new_pen = QtGui.QPen(
-                        QtGui.QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)), 6)
-                self.recolor_stream(stream, new_pen)
+        # The chains come from the index of the model (See graph_model.StreamChains)
+        chains = self.model.chains.start_chains() if only_starts else list(self.model.chains.members.values())
+
+        for chain in chains:
+            new_pen = QtGui.QPen(QtGui.QColor(QtCore.Qt.green), 2)
+            if recolor:
+                new_pen = QtGui.QPen(
+                    QtGui.QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)), 6)
+            self.recolor_chain(chain, new_pen)
+
+    def recolor_chain(self, chain, pen):
+        for chained_stream in chain:
+            if chained_stream.view is not None and chained_stream.view.output_line:
+                chained_stream.view.output_line.setPen(pen)
 
     def recolor_stream(self, stream, pen):
-        next_stream = stream.output_stream
-        if next_stream:
-            line = stream.output_line
-            line.setPen(pen)
-            self.recolor_stream(next_stream, pen)
+        # The whole chain the stream belongs to
+        self.recolor_chain(self.model.chains.chain_of(stream.model), pen)
+
+    def reset_chain_color(self, stream):
+        self.recolor_stream(stream, QtGui.QPen(QtGui.QColor(QtCore.Qt.green), 2))
 
     def save_to_file(self):
         dialog = QtWidgets.QFileDialog()
-        result = dialog.getSaveFileName(caption='Specify target file', filter='*.json')
+        result = dialog.getSaveFileName(caption='Specify target file', filter=NETWORK_SAVE_FILTERS)
         if not result[0] or not result[1]:
             return
 
         target_file = result[0]
-        the_dict = {}
-
-        for node in self.all_nodes:
-            the_dict[str(node)] = {'class': node.node_class,
-                                   'id': node.id,
-                                   'x_pos': node.x(),
-                                   'y_pos': node.y(),
-                                   'widget_value': node.get_widget_value(),
-                                   'stream_count': node.stream_count,
-                                   'streams': {}}
-            for stream in node.streams:
-                if stream.output_stream:
-                    the_dict[str(node)]['streams'][stream.index] = [stream.output_stream.parent_class,
-                                                                    stream.output_stream.parent_id,
-                                                                    stream.output_stream.index]
-
-        with open(target_file, 'w') as w:
-            json.dump(the_dict, w, indent=2)
+
+        network_format.write_network(self.model, target_file)
 
     def load_from_file(self):
         if self.all_nodes:
@@ -216,46 +264,101 @@ class CustomScene(QtWidgets.QGraphicsScene):
             return
 
         dialog = QtWidgets.QFileDialog()
-        result = dialog.getOpenFileName(caption='Specify source file', filter='*.json')
+        result = dialog.getOpenFileName(caption='Specify source file', filter=NETWORK_OPEN_FILTER)
         if not result[0] or not result[1]:
             return
 
         source_file = result[0]
 
-        with open(source_file, 'r') as r:
-            net_dict = json.load(r)
-
-        # Nodes creation
-        for n in net_dict:
-            new_node = self.add_node(net_dict[n]['class'], net_dict[n]['x_pos'], net_dict[n]['y_pos'])
-            new_node.relabel_id(net_dict[n]['id'])
-            new_node.set_widget_value(net_dict[n]['widget_value'])
-            for i in range(net_dict[n]['stream_count'] - 1):
-                new_node.add_stream()
-
-        max_id = max([n.id for n in self.all_nodes])
-        node_classes.GeneralNode.id_counter = max_id
+        # Read chunk by chunk, straight into the bulk loader
+        reader = network_format.NetworkReader(source_file)
+        try:
+            self.bulk_load(reader.node_records(), reader.connection_records())
+        finally:
+            reader.close()
 
-        # Nodes connection
-        for n in net_dict:
-            if not net_dict[n]['streams']:
-                continue
-
-            for index in net_dict[n]['streams']:
-                origin_stream = self.to_stream(net_dict[n]['class'], net_dict[n]['id'], int(index))
-                target_stream = self.to_stream(net_dict[n]['streams'][index][0], net_dict[n]['streams'][index][1],
-                                               net_dict[n]['streams'][index][2])
-
-                out_c = origin_stream.output_connector
-                in_c = target_stream.input_connector
+        # Framing
+        if self.all_nodes:
+            last_node = self.all_nodes[-1]
+            self.parent().centerOn(last_node.x() + 50, last_node.y() + 50)
+
+    # ------- BULK LOADING ------- #
+    def next_node_id(self):
+        return max(node_classes.GeneralNode.id_counter, self.model.id_counter) + 1
+
+    def builder(self):
+        # See graph_model.GraphBuilder
+        return graph_model.GraphBuilder(self)
+
+    def suspend_updates(self):
+        # No index, repaints nor signals while many items are added
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        self.blockSignals(True)
+        for view in self.views():
+            view.setUpdatesEnabled(False)
+
+    def resume_updates(self):
+        self.setItemIndexMethod(QtWidgets.QGraphicsScene.BspTreeIndex)
+        self.blockSignals(False)
+        for view in self.views():
+            view.setUpdatesEnabled(True)
 
-                new_l = self.draw_valid_line(out_c.center_point, in_c.center_point)
+        self.update()
+        self.schedule_level_of_detail()
+
+    # ------- LEVEL OF DETAIL ------- #
+    def schedule_level_of_detail(self):
+        if not self.lod_timer.isActive():
+            self.lod_timer.start()
+
+    def update_level_of_detail(self):
+        # Only the nodes in view are updated: the rest keep their state until they come into view
+        for view in self.views():
+            detailed = view.transform().m11() >= node_classes.DETAIL_MIN_ZOOM
+            visible_rect = view.mapToScene(view.viewport().rect()).boundingRect()
+            for item in self.items(visible_rect):
+                if isinstance(item, node_classes.GeneralNode):
+                    item.set_detailed(detailed)
+
+    def bulk_load(self, node_records, connection_records):
+        # Records as in graph_model.network_records. Nodes are indexed by (class, id) as they are created, and all
+        # the connection lines are created at the end, in one go
+        self.suspend_updates()
+        self.model.suspend_chains()
+        try:
+            nodes = {}
+            for node_class, node_id, x, y, value, stream_count in node_records:
+                new_node = self.add_node(node_class, x, y)
+                if new_node is None:
+                    raise ValueError('Unknown node class: {}'.format(node_class))
+                new_node.relabel_id(node_id)
+                if value is not None:
+                    new_node.set_widget_value(value)
+                for i in range(stream_count - 1):
+                    new_node.add_stream()
+
+                nodes[(node_class, node_id)] = new_node
+
+            if self.all_nodes:
+                node_classes.GeneralNode.id_counter = max(n.id for n in self.all_nodes)
+
+            # Connections
+            connectors = []
+            for origin_class, origin_id, origin_index, target_class, target_id, target_index in connection_records:
+                out_c = nodes[(origin_class, origin_id)].streams[origin_index].output_connector
+                in_c = nodes[(target_class, target_id)].streams[target_index].input_connector
+                connectors.append((out_c, in_c, self.valid_line(out_c.center_point, in_c.center_point)))
+
+            for out_c, in_c, new_l in connectors:
+                self.addItem(new_l)
                 out_c.register_connection(in_c, new_l)
                 in_c.register_connection(out_c, new_l)
 
-        # Framing
-        last_node = self.all_nodes[-1]
-        self.parent().centerOn(last_node.x() + 50, last_node.y() + 50)
+        finally:
+            self.model.resume_chains()
+            self.resume_updates()
+
+        return nodes
 
     def mousePressEvent(self, event):
         testing_connector = self.itemAt(event.scenePos(), QtGui.QTransform())
@@ -279,6 +382,10 @@ class CustomScene(QtWidgets.QGraphicsScene):
 
                 self.testing_origin_connector.toggle_connection(restore=True)
                 self.testing_target_connector.toggle_connection(restore=True)
+
+                # Both chains the connection split (As in delete_node)
+                self.reset_chain_color(self.testing_origin_connector.parent_stream)
+                self.reset_chain_color(self.testing_target_connector.parent_stream)
         else:
             self.testing_origin = None
             if testing_connector is None:
@@ -306,6 +413,9 @@ class CustomScene(QtWidgets.QGraphicsScene):
         QtWidgets.QGraphicsScene.mouseMoveEvent(self, event)
 
     def mouseReleaseEvent(self, event):
+        if self.moved_nodes:
+            self.flush_lines()
+
         self.testing_path.setPath(QtGui.QPainterPath())
         self.removeItem(self.testing_path)
         self.update()
@@ -357,7 +467,7 @@ class CustomScene(QtWidgets.QGraphicsScene):
         target_connector.register_connection(origin_connector, valid_line)
         origin_connector.register_connection(target_connector, valid_line)
 
-        self.color_streams(recolor=False, only_starts=False)
+        self.reset_chain_color(origin_connector.parent_stream)
 
     def keyPressEvent(self, event):
         if self.selected_node:
@@ -0,0 +1,128 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: execution_controller.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Runs the streams without freezing the interface, reporting the progress and allowing to cancel the run.
+       The Nuke API is not thread safe, so the run stays on the main thread: the interface is given back the control
+       between nodes, frames and render polls, so no slice of work is longer than one node or one frame.
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+from PySide2 import QtWidgets
+from PySide2 import QtCore
+
+import abstract_stream
+import run_log
+import tracing
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+FRAME_SLICE = 10
+
+
+class ExecutionController(QtCore.QObject, abstract_stream.RunProgress):
+
+    # SIGNALS
+    stream_progress = QtCore.Signal(int, int, str)  # Stream number, total streams, description
+    node_progress = QtCore.Signal(str, str, int)  # Stream description, node class, node id
+    frame_progress = QtCore.Signal(str, int, int)  # Stream description, first frame, last frame
+    running_changed = QtCore.Signal(bool)
+
+    def __init__(self, log, parent=None, frame_slice=FRAME_SLICE):
+        QtCore.QObject.__init__(self, parent)
+        abstract_stream.RunProgress.__init__(self)
+
+        # Writes are executed in slices of frames, to report (and be able to cancel) the run between them
+        self.frame_slice = frame_slice
+
+        # Log of the runs (See run_log.RunLog)
+        self.log = log
+        self.running = False
+
+        # Streams of the last run whose output has not been completely rendered
+        self.failed_renders = 0
+
+    # ------- RUN ------- #
+    def run(self, graph, write_mode=abstract_stream.IMMEDIATE_WRITE, workers=None, resume=False,
+            skip_unchanged=False, full_audit=False, trace_file=None):
+        if self.running:
+            return None
+
+        self.cancelled = False
+        self.failed_renders = 0
+        self.running = True
+        self.running_changed.emit(True)
+
+        if trace_file:
+            tracing.TRACER.start()
+
+        try:
+            executed_streams = graph.run(self.log, write_mode, workers, resume, skip_unchanged, self, full_audit)
+            self.failed_renders = len([stream for stream in executed_streams if stream.render_failed])
+            if self.failed_renders:
+                self.log.log('<b>[!]</b> {} streams have not been completely rendered, some of their render '
+                             'processes have failed'.format(self.failed_renders), run_log.ERROR)
+            return executed_streams
+        except abstract_stream.RunCancelled:
+            self.log.log('<b>[!]</b> The run has been cancelled, the temporary nodes created for the writes have been '
+                         'deleted', run_log.ERROR)
+            return None
+        finally:
+            if trace_file:
+                self.export_trace(trace_file)
+            self.log.flush()
+
+            self.running = False
+            self.running_changed.emit(False)
+
+    def export_trace(self, trace_file):
+        tracing.TRACER.stop()
+        try:
+            tracing.TRACER.export_chrome_trace(trace_file)
+            self.log.log('Timing trace saved to {} (Open it in chrome://tracing or https://ui.perfetto.dev)'
+                         ''.format(trace_file))
+        except (IOError, OSError) as e:
+            self.log.log('The timing trace could not be saved: {}'.format(e), run_log.WARNING)
+
+        # One record per line of the table (The rows of the feedback window are single lines)
+        for line in tracing.TRACER.summary_table().split('\n'):
+            self.log.log(line)
+
+    def cancel(self):
+        if self.running:
+            self.cancelled = True
+
+    # ------- PROGRESS ------- #
+    def stream_started(self, stream_number, total_streams, description):
+        self.stream_progress.emit(stream_number, total_streams, description)
+        self.process_events()
+
+    def node_executed(self, description, node_class, node_id):
+        self.node_progress.emit(description, node_class, node_id)
+        self.process_events()
+
+    def frames_written(self, description, first_frame, last_frame):
+        self.frame_progress.emit(description, first_frame, last_frame)
+        self.process_events()
+
+    def waiting(self):
+        self.process_events()
+
+    def process_events(self):
+        # Paints the feedback and receives the clicks (i.e. on the Cancel button) before the next slice of work
+        QtWidgets.QApplication.processEvents()
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: execution_plan.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Immutable execution plans, compiled from a graph model: for every Start stream, its ordered operations and
+       what they provide (writing info, checks and manipulations). Running a plan does not touch the graph at all.
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import collections
+import hashlib
+import json
+
+import node_logic
+
+
+# -------------------------------- PLAN RECORDS -------------------------------- #
+
+class PlanOperation(collections.namedtuple('PlanOperation', ['node_class', 'node_superclass', 'id', 'value'])):
+
+    __slots__ = ()
+
+    def get_widget_value(self):
+        return self.value
+
+    def run_node(self):
+        return node_logic.run_node(self.node_class, self.id, self.value)
+
+
+StreamPlan = collections.namedtuple('StreamPlan', ['description', 'start_node_id', 'stream_index', 'operations',
+                                                   'prefix_keys', 'loops', 'writing_operations', 'checks',
+                                                   'manipulations'])
+
+ExecutionPlan = collections.namedtuple('ExecutionPlan', ['structure_hash', 'streams'])
+
+
+# -------------------------------- COMPILATION -------------------------------- #
+
+def structure_hash(graph):
+    # Everything that changes how the network runs (Node positions do not)
+    structure = []
+    for node in graph.nodes:
+        outputs = [[stream.output_stream.parent_class, stream.output_stream.parent_id, stream.output_stream.index]
+                   if stream.output_stream else None for stream in node.streams]
+        structure.append([node.node_class, node.id, node.value, outputs])
+
+    return hashlib.sha1(json.dumps(structure).encode('utf-8')).hexdigest()
+
+def compile_stream(start_stream):
+    description = 'Stream number: {} | From node with ID:{}'.format(start_stream.index, start_stream.parent_node.id)
+
+    operations = ()
+    loops = False
+    if start_stream.output_stream:
+        streams, loops = start_stream.chain()
+        operations = tuple(PlanOperation(stream.parent_class, stream.parent_node.node_superclass, stream.parent_id,
+                                         stream.parent_node.value) for stream in streams[1:])
+
+    # Resolved writing info (The last node providing each field is the one used)
+    writing_operations = {}
+    for operation in operations:
+        if operation.node_superclass == 'WritingNodes':
+            writing_operations[node_logic.WRITING_INFOS[operation.node_class]] = operation
+
+    return StreamPlan(description, start_stream.parent_id, start_stream.index, operations, (), loops,
+                      tuple(sorted(writing_operations.items())),
+                      tuple(operation for operation in operations if operation.node_superclass == 'CheckNodes'),
+                      frozenset(operation.node_class for operation in operations
+                                if operation.node_superclass == 'Manipulation'))
+
+def prefix_trie_keys(stream_plans):
+    # Trie of the operation sequences of all the streams: every operation gets the key of its trie node, which is
+    # shared by all the streams starting with the same nodes (Same class and value) up to that operation
+    trie_nodes = {}
+    all_keys = []
+    for stream_plan in stream_plans:
+        keys = []
+        parent_key = None
+        for operation in stream_plan.operations:
+            parent_key = trie_nodes.setdefault((parent_key, operation.node_class, operation.value), len(trie_nodes))
+            keys.append(parent_key)
+        all_keys.append(tuple(keys))
+
+    return all_keys
+
+def compile_graph(graph, current_hash=None):
+    if current_hash is None:
+        current_hash = structure_hash(graph)
+
+    stream_plans = [compile_stream(start_stream) for start_stream in graph.start_streams()]
+    stream_plans = [stream_plan._replace(prefix_keys=keys)
+                    for stream_plan, keys in zip(stream_plans, prefix_trie_keys(stream_plans))]
+
+    return ExecutionPlan(current_hash, tuple(stream_plans))
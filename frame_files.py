@@ -0,0 +1,79 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: frame_files.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Frame files on disk for a write path pattern (i.e. /renders/comp#####_v.0001.exr)
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import os
+import re
+
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+PADDING_REGEX = re.compile('#+')
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def frame_file_names(path_pattern, start_frame, end_frame):
+    # File name of every frame, by frame number
+    file_name = os.path.basename(path_pattern)
+    padding = None
+    for padding in PADDING_REGEX.finditer(file_name):
+        pass
+
+    if padding is None:
+        return dict((frame, file_name) for frame in range(start_frame, end_frame + 1))
+
+    head, tail, width = file_name[:padding.start()], file_name[padding.end():], padding.end() - padding.start()
+    return dict((frame, head + str(frame).zfill(width) + tail) for frame in range(start_frame, end_frame + 1))
+
+def rendered_file_names(directory, candidate_names):
+    # One single listing of the directory, only the candidates are stat'ed (Empty files do not count as rendered)
+    if not os.path.isdir(directory):
+        return set()
+
+    if scandir is not None:
+        return set(entry.name for entry in scandir(directory)
+                   if entry.name in candidate_names and entry.is_file() and entry.stat().st_size > 0)
+
+    return set(name for name in os.listdir(directory)
+               if name in candidate_names and os.path.getsize(os.path.join(directory, name)) > 0)
+
+def missing_frames(path_pattern, start_frame, end_frame):
+    names_by_frame = frame_file_names(path_pattern, start_frame, end_frame)
+    rendered_names = rendered_file_names(os.path.dirname(path_pattern), set(names_by_frame.values()))
+
+    return [frame for frame in sorted(names_by_frame) if names_by_frame[frame] not in rendered_names]
+
+def contiguous_ranges(frames):
+    ranges = []
+    for frame in frames:
+        if ranges and ranges[-1][1] == frame - 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+
+    return [tuple(frame_range) for frame_range in ranges]
@@ -0,0 +1,485 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: graph_model.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Lightweight data model of a network (nodes, streams and connections), with no Qt at all.
+       The graphic items of the editor are views bound to these records.
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import abstract_stream
+import execution_plan
+import node_logic
+
+
+# -------------------------------- RECORDS -------------------------------- #
+
+class ModelNode(object):
+
+    __slots__ = ('node_class', 'node_superclass', 'id', 'value', 'x', 'y', 'streams', 'graph', 'view')
+
+    def __init__(self, node_class, node_id, value=None, stream_count=0, x=0, y=0, node_superclass=None):
+
+        # BASIC PROPERTIES
+        self.node_class = node_class
+        self.node_superclass = node_superclass or node_logic.NODE_SUPERCLASSES[node_class]
+        self.id = node_id
+
+        # STATE
+        self.value = value
+        self.x = x
+        self.y = y
+
+        # STREAMS
+        self.graph = None
+        self.streams = []
+        for i in range(stream_count):
+            self.add_stream()
+
+        # Graphic item bound to this node, if any
+        self.view = None
+
+    @property
+    def stream_count(self):
+        return len(self.streams)
+
+    def add_stream(self):
+        new_stream = ModelStream(self, len(self.streams))
+        self.streams.append(new_stream)
+        self.changed()
+        return new_stream
+
+    def remove_stream(self):
+        stream_to_delete = self.streams.pop()
+        stream_to_delete.disconnect()
+        if self.graph is not None:
+            self.graph.chains.forget(stream_to_delete)
+        self.changed()
+        return stream_to_delete
+
+    def set_id(self, node_id):
+        self.id = node_id
+        self.changed()
+
+    def set_value(self, value):
+        if value != self.value:
+            self.value = value
+            self.changed()
+
+    def changed(self):
+        # Anything that changes how the network runs (Positions do not)
+        if self.graph is not None:
+            self.graph.changed()
+
+    def connection_changed(self, output_stream, input_stream):
+        if self.graph is not None:
+            self.graph.chains.connection_changed(output_stream, input_stream)
+        self.changed()
+
+    def get_widget_value(self):
+        return self.value
+
+    def run_node(self):
+        return node_logic.run_node(self.node_class, self.id, self.value)
+
+    def __str__(self):
+        return self.node_class + '_' + str(self.id)
+
+
+class ModelStream(object):
+
+    __slots__ = ('parent_node', 'index', 'input_connection', 'output_connection', 'view')
+
+    def __init__(self, parent_node, stream_index):
+        self.parent_node = parent_node
+        self.index = stream_index
+
+        # CONNECTIONS
+        self.input_connection = None
+        self.output_connection = None
+
+        # Graphic item bound to this stream, if any
+        self.view = None
+
+    @property
+    def parent_class(self):
+        return self.parent_node.node_class
+
+    @property
+    def parent_id(self):
+        return self.parent_node.id
+
+    @property
+    def input_stream(self):
+        return self.input_connection.output_stream if self.input_connection else None
+
+    @property
+    def output_stream(self):
+        return self.output_connection.input_stream if self.output_connection else None
+
+    def connect(self, target_stream):
+        self.disconnect_output()
+        target_stream.disconnect_input()
+
+        connection = ModelConnection(self, target_stream)
+        self.output_connection = connection
+        target_stream.input_connection = connection
+        self.parent_node.connection_changed(self, target_stream)
+
+        return connection
+
+    def disconnect_input(self):
+        if self.input_connection:
+            output_stream = self.input_connection.output_stream
+            output_stream.output_connection = None
+            self.input_connection = None
+            self.parent_node.connection_changed(output_stream, self)
+
+    def disconnect_output(self):
+        if self.output_connection:
+            input_stream = self.output_connection.input_stream
+            input_stream.input_connection = None
+            self.output_connection = None
+            self.parent_node.connection_changed(self, input_stream)
+
+    def disconnect(self):
+        self.disconnect_input()
+        self.disconnect_output()
+
+    def chain(self):
+        # Flat list of the streams that follow this one (Included), and whether they loop back on themselves
+        streams = []
+        visited = set()
+
+        stream = self
+        while stream is not None:
+            if stream in visited:
+                return streams, True
+
+            visited.add(stream)
+            streams.append(stream)
+            stream = stream.output_stream
+
+        return streams, False
+
+
+class ModelConnection(object):
+
+    __slots__ = ('output_stream', 'input_stream')
+
+    def __init__(self, output_stream, input_stream):
+        self.output_stream = output_stream
+        self.input_stream = input_stream
+
+
+# -------------------------------- STREAM CHAINS -------------------------------- #
+
+class StreamChains(object):
+
+    # Chains of connected streams, by their head (The stream with no input). Kept up to date on every connection
+    # change, only rebuilding the chains involved in it
+
+    def __init__(self):
+        self.head_of = {}
+        self.members = {}
+
+        # Suspended while building big graphs (See rebuild)
+        self.enabled = True
+
+    def head(self, stream):
+        visited = set()
+        while stream.input_stream is not None and stream not in visited:
+            visited.add(stream)
+            stream = stream.input_stream
+
+        return stream
+
+    def update_chain(self, stream):
+        head = self.head(stream)
+        members = head.chain()[0]
+
+        for member in members:
+            # The old head of a member is dropped only if it is no longer a head (i.e. after a merge of chains)
+            old_head = self.head_of.get(member)
+            if old_head is not None and old_head is not head and old_head.input_stream is not None:
+                self.members.pop(old_head, None)
+            self.head_of[member] = head
+
+        self.members[head] = members
+        return head
+
+    def chain_of(self, stream):
+        head = self.head_of.get(stream)
+        if head is None or not self.enabled:
+            head = self.update_chain(stream)
+
+        return self.members[head]
+
+    def connection_changed(self, output_stream, input_stream):
+        # Both ends: after a disconnection they are in different chains
+        if self.enabled:
+            self.update_chain(output_stream)
+            self.update_chain(input_stream)
+
+    def forget(self, stream):
+        head = self.head_of.pop(stream, None)
+        if head is stream:
+            self.members.pop(stream, None)
+
+    def rebuild(self, nodes):
+        self.head_of = {}
+        self.members = {}
+        for node in nodes:
+            for stream in node.streams:
+                if stream not in self.head_of:
+                    self.update_chain(stream)
+
+    def start_chains(self):
+        return [members for head, members in self.members.items() if head.parent_class == 'Start']
+
+
+# -------------------------------- GRAPH -------------------------------- #
+
+class GraphModel(object):
+
+    def __init__(self):
+        self.nodes = []
+        self.id_counter = 0
+
+        # Bumped on every change of nodes, connections or widget values (See changed)
+        self.revision = 0
+
+        # Last compiled execution plan, reused while the network does not change
+        self.plan = None
+        self.plan_revision = None
+
+        # Chains of connected streams
+        self.chains = StreamChains()
+
+    # ------- NODES ------- #
+    def add_node(self, node_class, node_id=None, value=None, stream_count=1, x=0, y=0):
+        if node_id is None:
+            node_id = self.id_counter + 1
+
+        return self.register_node(ModelNode(node_class, node_id, value, stream_count, x, y))
+
+    def register_node(self, node):
+        self.nodes.append(node)
+        self.id_counter = max(self.id_counter, node.id)
+        node.graph = self
+        self.changed()
+        return node
+
+    def remove_node(self, node):
+        for stream in node.streams:
+            stream.disconnect()
+            self.chains.forget(stream)
+        self.nodes.remove(node)
+        node.graph = None
+        self.changed()
+
+    def changed(self):
+        self.revision += 1
+
+    def find_node(self, node_class, node_id):
+        for node in self.nodes:
+            if node.node_class == node_class and node.id == node_id:
+                return node
+
+        return None
+
+    def to_stream(self, node_class, node_id, stream_index):
+        node = self.find_node(node_class, node_id)
+        if node is None or stream_index >= node.stream_count:
+            return None
+
+        return node.streams[stream_index]
+
+    # ------- CONNECTIONS ------- #
+    def connect(self, output_stream, input_stream):
+        return output_stream.connect(input_stream)
+
+    def connections(self):
+        return [stream.output_connection for node in self.nodes for stream in node.streams if stream.output_connection]
+
+    # ------- EXECUTION ------- #
+    def start_streams(self):
+        return [stream for node in self.nodes if node.node_class == 'Start' for stream in node.streams]
+
+    def structure_hash(self):
+        return execution_plan.structure_hash(self)
+
+    def execution_plan(self):
+        # Compiled again only if the network changed since the last plan (And its structure is really different)
+        if self.plan is not None and self.plan_revision == self.revision:
+            return self.plan
+
+        current_hash = self.structure_hash()
+        if self.plan is None or self.plan.structure_hash != current_hash:
+            self.plan = execution_plan.compile_graph(self, current_hash)
+        self.plan_revision = self.revision
+
+        return self.plan
+
+    def run(self, log, write_mode=abstract_stream.IMMEDIATE_WRITE, workers=None, resume=False,
+            skip_unchanged=False, progress=None, full_audit=False):
+        return abstract_stream.run_plan(self.execution_plan(), log, write_mode, workers, resume,
+                                        skip_unchanged, progress, full_audit)
+
+    # ------- SERIALIZATION ------- #
+    def to_dict(self):
+        the_dict = {}
+
+        for node in self.nodes:
+            the_dict[str(node)] = {'class': node.node_class,
+                                   'id': node.id,
+                                   'x_pos': node.x,
+                                   'y_pos': node.y,
+                                   'widget_value': node.value,
+                                   'stream_count': node.stream_count,
+                                   'streams': {}}
+            for stream in node.streams:
+                if stream.output_stream:
+                    the_dict[str(node)]['streams'][stream.index] = [stream.output_stream.parent_class,
+                                                                    stream.output_stream.parent_id,
+                                                                    stream.output_stream.index]
+
+        return the_dict
+
+    @classmethod
+    def from_dict(cls, net_dict):
+        graph = cls()
+        graph.bulk_load(*network_records(net_dict))
+
+        graph.nodes.sort(key=lambda node: node.id)
+        return graph
+
+    def bulk_load(self, node_records, connection_records):
+        # See network_records. Nodes are indexed by (class, id), so every connection is found right away
+        self.suspend_chains()
+        try:
+            nodes = {}
+            for node_class, node_id, x, y, value, stream_count in node_records:
+                nodes[(node_class, node_id)] = self.add_node(node_class, node_id, value, stream_count, x, y)
+
+            for origin_class, origin_id, origin_index, target_class, target_id, target_index in connection_records:
+                self.connect(nodes[(origin_class, origin_id)].streams[origin_index],
+                             nodes[(target_class, target_id)].streams[target_index])
+        finally:
+            self.resume_chains()
+
+        return nodes
+
+    def next_node_id(self):
+        return self.id_counter + 1
+
+    def builder(self):
+        return GraphBuilder(self)
+
+    def suspend_chains(self):
+        self.chains.enabled = False
+
+    def resume_chains(self):
+        # All the chains at once (Rebuilding them on every connection would be quadratic)
+        self.chains.enabled = True
+        self.chains.rebuild(self.nodes)
+
+
+# -------------------------------- BUILDING -------------------------------- #
+
+class GraphBuilder(object):
+
+    # Builds many nodes and connections in one go, on a GraphModel or on a CustomScene (Anything with next_node_id and
+    # bulk_load). Nodes are referred to by the (class, id) keys that add_node returns:
+    #   builder = graph.builder()
+    #   start = builder.add_node('Start')
+    #   origin = builder.add_node('Origin', value='Read1')
+    #   builder.connect(start, origin)
+    #   nodes = builder.build()
+
+    def __init__(self, target):
+        self.target = target
+        self.next_id = target.next_node_id()
+
+        self.node_records = []
+        self.connection_records = []
+
+        self.stream_counts = {}
+        self.used_outputs = set()
+        self.used_inputs = set()
+
+    def add_node(self, node_class, value=None, stream_count=1, x=0, y=0):
+        # Everything is validated before building, so a wrong batch never leaves a partial graph behind
+        if node_class not in node_logic.NODE_SUPERCLASSES:
+            raise ValueError('Unknown node class: {}'.format(node_class))
+
+        key = (node_class, self.next_id)
+        self.next_id += 1
+
+        self.node_records.append((node_class, key[1], x, y, value, stream_count))
+        self.stream_counts[key] = stream_count
+
+        return key
+
+    def connect(self, origin, target, origin_index=0, target_index=0):
+        for key, index in ((origin, origin_index), (target, target_index)):
+            if key not in self.stream_counts:
+                raise ValueError('The node {} was not added to this builder'.format(key))
+            if not 0 <= index < self.stream_counts[key]:
+                raise ValueError('The node {} has no stream {}'.format(key, index))
+
+        if target[0] in node_logic.NO_INPUT_CLASSES:
+            raise ValueError('{} nodes cannot receive connections'.format(target[0]))
+
+        # Every stream has a single input and a single output
+        if (origin, origin_index) in self.used_outputs or (target, target_index) in self.used_inputs:
+            raise ValueError('The stream {} of {} or the stream {} of {} is already connected'
+                             ''.format(origin_index, origin, target_index, target))
+
+        self.used_outputs.add((origin, origin_index))
+        self.used_inputs.add((target, target_index))
+        self.connection_records.append(origin + (origin_index,) + target + (target_index,))
+
+    def chain(self, keys, stream_index=0):
+        # Connects the nodes one after another, all through the same stream
+        for origin, target in zip(keys[:-1], keys[1:]):
+            self.connect(origin, target, stream_index, stream_index)
+
+    def build(self):
+        # Dict of the new nodes (Model nodes or scene nodes) by their key
+        return self.target.bulk_load(self.node_records, self.connection_records)
+
+
+# -------------------------------- RECORDS OF SAVED NETWORKS -------------------------------- #
+
+def network_records(net_dict):
+    # Saved network (See GraphModel.to_dict) as two lists of records:
+    #   nodes: (class, id, x, y, widget value, stream count)
+    #   connections: (origin class, origin id, origin stream index, target class, target id, target stream index)
+    node_records = []
+    connection_records = []
+    for n in net_dict:
+        node = net_dict[n]
+        node_records.append((node['class'], node['id'], node['x_pos'], node['y_pos'], node['widget_value'],
+                             node['stream_count']))
+
+        for index in node['streams']:
+            target_class, target_id, target_index = node['streams'][index]
+            connection_records.append((node['class'], node['id'], int(index), target_class, target_id, target_index))
+
+    return node_records, connection_records
@@ -0,0 +1,285 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: log_view.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Feedback window side of the run log: a model of the last records (ring buffer), a filter on top of it and a
+       list view that only paints the visible rows
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+from PySide2 import QtWidgets
+from PySide2 import QtGui
+from PySide2 import QtCore
+import collections
+
+import run_log
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+FLUSH_INTERVAL = 100  # Milliseconds
+MAX_RECORDS = 20000
+
+LEVEL_ROLE = QtCore.Qt.UserRole + 1
+STREAM_ROLE = QtCore.Qt.UserRole + 2
+NODE_CLASS_ROLE = QtCore.Qt.UserRole + 3
+
+ALL_ITEMS = 'All'
+
+
+# -------------------------------- MODELS -------------------------------- #
+
+class LogRecordsModel(QtCore.QAbstractListModel):
+
+    # Only the last records are kept (The oldest ones are dropped once the cap is reached)
+
+    labels_added = QtCore.Signal()
+
+    def __init__(self, max_records=MAX_RECORDS, parent=None):
+        QtCore.QAbstractListModel.__init__(self, parent)
+
+        self.max_records = max_records
+        self.records = collections.deque(maxlen=max_records)
+
+        # Values seen so far, to filter by them
+        self.streams = []
+        self.node_classes = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        record = self.records[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return record.to_text()
+        if role == QtCore.Qt.ToolTipRole:
+            return record.message
+        if role == QtCore.Qt.ForegroundRole:
+            return QtGui.QBrush(QtGui.QColor(run_log.LEVEL_COLORS[record.level]))
+        if role == QtCore.Qt.FontRole and record.level == run_log.STREAM:
+            font = QtGui.QFont()
+            font.setBold(True)
+            return font
+        if role == LEVEL_ROLE:
+            return record.level
+        if role == STREAM_ROLE:
+            return record.stream
+        if role == NODE_CLASS_ROLE:
+            return record.node_class
+
+        return None
+
+    def add_records(self, records):
+        records = records[-self.max_records:]
+        if not records:
+            return
+
+        # Drop the oldest records, to make room for the new ones
+        overflow = len(self.records) + len(records) - self.max_records
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            for i in range(overflow):
+                self.records.popleft()
+            self.endRemoveRows()
+
+        first_row = len(self.records)
+        self.beginInsertRows(QtCore.QModelIndex(), first_row, first_row + len(records) - 1)
+        self.records.extend(records)
+        self.endInsertRows()
+
+        new_labels = False
+        for record in records:
+            if record.stream and record.stream not in self.streams:
+                self.streams.append(record.stream)
+                new_labels = True
+            if record.node_class and record.node_class not in self.node_classes:
+                self.node_classes.append(record.node_class)
+                new_labels = True
+
+        if new_labels:
+            self.labels_added.emit()
+
+    def clear(self):
+        self.beginResetModel()
+        self.records.clear()
+        self.streams = []
+        self.node_classes = []
+        self.endResetModel()
+        self.labels_added.emit()
+
+
+class LogFilterModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent=None):
+        QtCore.QSortFilterProxyModel.__init__(self, parent)
+        self.setDynamicSortFilter(True)
+
+        # None means no filter
+        self.stream = None
+        self.level = None
+        self.node_class = None
+
+    def set_filters(self, stream=None, level=None, node_class=None):
+        self.stream = stream
+        self.level = level
+        self.node_class = node_class
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        record = self.sourceModel().records[source_row]
+
+        if self.stream is not None and record.stream != self.stream:
+            return False
+        if self.level is not None and record.level != self.level:
+            return False
+        if self.node_class is not None and record.node_class != self.node_class:
+            return False
+
+        return True
+
+
+# -------------------------------- SINKS -------------------------------- #
+
+class QtLogSink(QtCore.QObject, run_log.LogSink):
+
+    # Records are buffered and added to the model in batches, on a timer (One view update per batch, not per record)
+
+    def __init__(self, records_model, flush_interval=FLUSH_INTERVAL, parent=None):
+        QtCore.QObject.__init__(self, parent)
+
+        self.records_model = records_model
+        self.pending = []
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(flush_interval)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def emit(self, record):
+        self.pending.append(record)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        self.timer.stop()
+        records, self.pending = self.pending, []
+        self.records_model.add_records(records)
+
+    def clear(self):
+        self.pending = []
+        self.records_model.clear()
+
+
+# -------------------------------- PANEL -------------------------------- #
+
+class LogPanel(QtWidgets.QWidget):
+
+    def __init__(self, max_records=MAX_RECORDS, parent=None):
+        QtWidgets.QWidget.__init__(self, parent)
+
+        # MODELS
+        self.records_model = LogRecordsModel(max_records, self)
+        self.filter_model = LogFilterModel(self)
+        self.filter_model.setSourceModel(self.records_model)
+
+        # LAYOUT
+        self.grid = QtWidgets.QGridLayout(self)
+        self.grid.setContentsMargins(0, 0, 0, 0)
+
+        # ELEMENTS
+        self.stream_combo = QtWidgets.QComboBox()
+        self.stream_combo.setMinimumWidth(260)
+        self.grid.addWidget(self.stream_combo, 0, 0, 1, 1)
+
+        self.level_combo = QtWidgets.QComboBox()
+        self.level_combo.addItems([ALL_ITEMS] + list(run_log.LEVELS))
+        self.grid.addWidget(self.level_combo, 0, 1, 1, 1)
+
+        self.node_class_combo = QtWidgets.QComboBox()
+        self.grid.addWidget(self.node_class_combo, 0, 2, 1, 1)
+
+        self.first_failure_btn = QtWidgets.QPushButton('Jump to first failure')
+        self.grid.addWidget(self.first_failure_btn, 0, 3, 1, 1)
+
+        # Uniform rows: the view only lays out and paints the visible ones
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.filter_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setWordWrap(False)
+        self.list_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.grid.addWidget(self.list_view, 1, 0, 1, 4)
+
+        self.sink = QtLogSink(self.records_model, parent=self)
+        self.follow_tail = True
+
+        # CONNECTIONS
+        self.stream_combo.currentIndexChanged.connect(self.update_filters)
+        self.level_combo.currentIndexChanged.connect(self.update_filters)
+        self.node_class_combo.currentIndexChanged.connect(self.update_filters)
+        self.first_failure_btn.clicked.connect(self.jump_to_first_failure)
+        self.records_model.labels_added.connect(self.update_labels)
+        self.records_model.rowsAboutToBeInserted.connect(self.check_tail)
+        self.records_model.rowsInserted.connect(self.scroll_to_tail)
+
+        self.update_labels()
+
+    # ------- FILTERS ------- #
+    def update_labels(self):
+        # The filters are only applied again if a selected label is gone (Filtering all the records is not free)
+        selection_lost = False
+        for combo, labels in [(self.stream_combo, self.records_model.streams),
+                              (self.node_class_combo, self.records_model.node_classes)]:
+            current = combo.currentText()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems([ALL_ITEMS] + labels)
+            combo.setCurrentIndex(max(combo.findText(current), 0))
+            combo.blockSignals(False)
+            selection_lost = selection_lost or combo.currentText() != current
+
+        if selection_lost:
+            self.update_filters()
+
+    def update_filters(self, *args):
+        filters = []
+        for combo in (self.stream_combo, self.level_combo, self.node_class_combo):
+            filters.append(combo.currentText() if combo.currentIndex() > 0 else None)
+
+        self.filter_model.set_filters(*filters)
+
+    # ------- NAVIGATION ------- #
+    def check_tail(self, *args):
+        scroll_bar = self.list_view.verticalScrollBar()
+        self.follow_tail = scroll_bar.value() == scroll_bar.maximum()
+
+    def scroll_to_tail(self, *args):
+        if self.follow_tail:
+            self.list_view.scrollToBottom()
+
+    def jump_to_first_failure(self):
+        for row, record in enumerate(self.records_model.records):
+            if record.level != run_log.ERROR:
+                continue
+
+            index = self.filter_model.mapFromSource(self.records_model.index(row))
+            if index.isValid():
+                self.list_view.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtTop)
+                self.list_view.setCurrentIndex(index)
+                return
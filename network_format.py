@@ -0,0 +1,203 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: network_format.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Files of saved networks. The compact format is columnar JSON lines (Optionally gzip compressed):
+
+    {"format": "scene_checks_network", "version": 1, "classes": [...], "node_count": N, "connection_count": M}
+    {"nodes": {"class": [...], "id": [...], "x": [...], "y": [...], "value": [...], "stream_count": [...]}}
+    ...
+    {"edges": [[origin node row, origin stream index, target node row, target stream index], ...]}
+    ...
+
+    Node classes are stored as indices of the "classes" list, and edges refer to nodes by their row in the file.
+    The files saved by the first versions (One JSON dict, see graph_model.GraphModel.to_dict) are still read.
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import gzip
+import json
+
+import graph_model
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+FORMAT_NAME = 'scene_checks_network'
+FORMAT_VERSION = 1
+
+CHUNK_SIZE = 1000
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+LEGACY_EXTENSION = '.json'
+COMPRESSED_EXTENSION = '.gz'
+
+
+# -------------------------------- WRITING -------------------------------- #
+
+def write_network(graph, path, compress=None):
+    # Legacy JSON for .json files, columnar JSON lines otherwise (Compressed for .gz files, unless specified)
+    if path.endswith(LEGACY_EXTENSION):
+        with open(path, 'w') as w:
+            json.dump(graph.to_dict(), w, indent=2)
+        return
+
+    if compress is None:
+        compress = path.endswith(COMPRESSED_EXTENSION)
+
+    with (gzip.open(path, 'wb') if compress else open(path, 'wb')) as w:
+        for line in iter_columnar_lines(graph):
+            w.write((json.dumps(line, separators=(',', ':')) + '\n').encode('utf-8'))
+
+def iter_columnar_lines(graph):
+    classes = sorted(set(node.node_class for node in graph.nodes))
+    class_indices = dict((node_class, i) for i, node_class in enumerate(classes))
+    node_rows = dict((node, row) for row, node in enumerate(graph.nodes))
+    connections = graph.connections()
+
+    yield {'format': FORMAT_NAME,
+           'version': FORMAT_VERSION,
+           'classes': classes,
+           'node_count': len(graph.nodes),
+           'connection_count': len(connections)}
+
+    for chunk_start in range(0, len(graph.nodes), CHUNK_SIZE):
+        nodes = graph.nodes[chunk_start:chunk_start + CHUNK_SIZE]
+        yield {'nodes': {'class': [class_indices[node.node_class] for node in nodes],
+                         'id': [node.id for node in nodes],
+                         'x': [node.x for node in nodes],
+                         'y': [node.y for node in nodes],
+                         'value': [node.value for node in nodes],
+                         'stream_count': [node.stream_count for node in nodes]}}
+
+    for chunk_start in range(0, len(connections), CHUNK_SIZE):
+        yield {'edges': [[node_rows[connection.output_stream.parent_node], connection.output_stream.index,
+                          node_rows[connection.input_stream.parent_node], connection.input_stream.index]
+                         for connection in connections[chunk_start:chunk_start + CHUNK_SIZE]]}
+
+
+# -------------------------------- READING -------------------------------- #
+
+class NetworkReader(object):
+
+    # Reads the records of a network file (See graph_model.network_records) one chunk at a time:
+    #   reader = NetworkReader(path)
+    #   scene.bulk_load(reader.node_records(), reader.connection_records())
+    # All the nodes are read before the connections, as the bulk loaders need them
+
+    def __init__(self, path):
+        self.path = path
+
+        self.header = None
+        self.legacy_records = None
+
+        # (class, id) of every node, by row
+        self.node_keys = []
+
+        with open(path, 'rb') as r:
+            self.compressed = r.read(2) == GZIP_MAGIC
+
+        self.file = gzip.open(path, 'rb') if self.compressed else open(path, 'rb')
+        self.pending_line = None
+        self.read_header()
+
+    def read_header(self):
+        first_line = self.file.readline()
+        try:
+            header = json.loads(first_line.decode('utf-8'))
+        except ValueError:
+            header = None
+
+        if isinstance(header, dict) and header.get('format') == FORMAT_NAME:
+            if header.get('version', 0) > FORMAT_VERSION:
+                self.close()
+                raise ValueError('The network file {} was saved with a newer version of the format ({})'
+                                 ''.format(self.path, header['version']))
+            self.header = header
+            return
+
+        # Legacy file (One single JSON dict)
+        rest = first_line + self.file.read()
+        self.close()
+        self.legacy_records = graph_model.network_records(json.loads(rest.decode('utf-8')))
+
+    def iter_chunks(self):
+        # The file is left open at the end (Closed by close), as both record generators read from it
+        while True:
+            if self.pending_line is not None:
+                line, self.pending_line = self.pending_line, None
+            elif self.file.closed:
+                return
+            else:
+                line = self.file.readline()
+
+            if not line:
+                return
+
+            if line.strip():
+                yield line, json.loads(line.decode('utf-8'))
+
+    def node_records(self):
+        if self.legacy_records is not None:
+            for record in self.legacy_records[0]:
+                self.node_keys.append(record[:2])
+                yield record
+            return
+
+        classes = self.header['classes']
+        for line, chunk in self.iter_chunks():
+            if 'nodes' not in chunk:
+                # First chunk of connections, left for connection_records
+                self.pending_line = line
+                return
+
+            columns = chunk['nodes']
+            for class_index, node_id, x, y, value, stream_count in zip(columns['class'], columns['id'], columns['x'],
+                                                                       columns['y'], columns['value'],
+                                                                       columns['stream_count']):
+                self.node_keys.append((classes[class_index], node_id))
+                yield (classes[class_index], node_id, x, y, value, stream_count)
+
+    def connection_records(self):
+        if self.legacy_records is not None:
+            for record in self.legacy_records[1]:
+                yield record
+            return
+
+        for line, chunk in self.iter_chunks():
+            for origin_row, origin_index, target_row, target_index in chunk.get('edges', []):
+                origin_class, origin_id = self.node_keys[origin_row]
+                target_class, target_id = self.node_keys[target_row]
+                yield (origin_class, origin_id, origin_index, target_class, target_id, target_index)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+def load_graph(path):
+    reader = NetworkReader(path)
+    try:
+        graph = graph_model.GraphModel()
+        graph.bulk_load(reader.node_records(), reader.connection_records())
+    finally:
+        reader.close()
+
+    graph.nodes.sort(key=lambda node: node.id)
+    return graph
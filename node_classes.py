@@ -24,10 +24,9 @@ __status__ = 'Testing'
 from PySide2 import QtWidgets
 from PySide2 import QtCore
 from PySide2 import QtGui
-import os
 
-import nuke_specifics
-import abstract_stream
+import graph_model
+import scene_names_model
 
 
 # -------------------------------- CONSTANTS -------------------------------- #
@@ -42,6 +41,45 @@ SQUARE_DIAGONAL = 8   #(more precisely, half-diagonal)
 CONNECTOR_AVAILABLE_COLOR = QtCore.Qt.darkYellow
 CONNECTOR_USED_COLOR = QtCore.Qt.green
 
+# Level of detail (Below this zoom the nodes are drawn as flat rectangles, with no streams, texts nor widgets)
+DETAIL_MIN_ZOOM = 0.45
+
+
+# -------------------------------- BRUSHES -------------------------------- #
+# ------------------------------------------------------------------------- #
+
+# Shared by all the items of the same color (The gradients are relative to the bounding rect of each item)
+BRUSHES = {}
+
+def node_brush(r, g, b):
+    key = ('node', r, g, b)
+    if key not in BRUSHES:
+        grad = QtGui.QLinearGradient(0, 0, 0, 1)
+        grad.setCoordinateMode(QtGui.QGradient.ObjectBoundingMode)
+        grad.setColorAt(0.5, QtGui.QColor(r, g, b))
+        grad.setColorAt(1.0, QtGui.QColor(r + 20, g + 20, b + 20))
+        BRUSHES[key] = QtGui.QBrush(grad)
+
+    return BRUSHES[key]
+
+def stream_brush(r, g, b):
+    key = ('stream', r, g, b)
+    if key not in BRUSHES:
+        grad = QtGui.QLinearGradient(0, 0, 0, 1)
+        grad.setCoordinateMode(QtGui.QGradient.ObjectBoundingMode)
+        grad.setColorAt(0.0, QtGui.QColor(r, g, b))
+        grad.setColorAt(1.0, QtGui.QColor(r + 10, g + 10, b + 10))
+        BRUSHES[key] = QtGui.QBrush(grad)
+
+    return BRUSHES[key]
+
+def flat_brush(r, g, b):
+    key = ('flat', r, g, b)
+    if key not in BRUSHES:
+        BRUSHES[key] = QtGui.QBrush(QtGui.QColor(r, g, b))
+
+    return BRUSHES[key]
+
 
 # -------------------------------- NODE-RELATED CLASSES -------------------------------- #
 # -------------------------------------------------------------------------------------- #
@@ -74,7 +112,11 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
 
         # ID OF THE NODE
         GeneralNode.id_counter += 1
-        self.id = GeneralNode.id_counter
+
+        # DATA MODEL OF THE NODE (This item is only its view)
+        self.model = graph_model.ModelNode(self.node_class, GeneralNode.id_counter,
+                                           node_superclass=self.node_superclass)
+        self.model.view = self
 
         # BASIC NODE PROPERTIES
         self.extra_header = 0
@@ -82,17 +124,25 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         self.max_streams = 16
         self.is_selected = False
 
+        # LEVEL OF DETAIL (See CustomScene.update_level_of_detail)
+        self.detailed = True
+        self.proxies_created = False
+        self.flat_rect = QtCore.QRectF()
+
         # STREAMS
-        self.stream_count = 0
         self.streams = []
 
         # GRAPHICS OF THE NODE
         QtWidgets.QGraphicsPathItem.__init__(self)
-        self.setFlags(QtWidgets.QGraphicsPathItem.ItemIsMovable)
+        self.setFlags(QtWidgets.QGraphicsPathItem.ItemIsMovable | QtWidgets.QGraphicsPathItem.ItemIsSelectable |
+                      QtWidgets.QGraphicsPathItem.ItemSendsGeometryChanges)
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
 
         self.id_text = QtWidgets.QGraphicsSimpleTextItem(parent=self)
-        self.proxy_add_btn = QtWidgets.QGraphicsProxyWidget(parent=self)
-        self.proxy_remove_btn = QtWidgets.QGraphicsProxyWidget(parent=self)
+
+        # Embedded widgets, created once the node is first seen in detail (See create_proxies)
+        self.proxy_add_btn = None
+        self.proxy_remove_btn = None
 
         self.marquee = QtWidgets.QGraphicsPathItem(parent=self)
 
@@ -100,6 +150,15 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         self.setup_node()
         self.add_stream()
         self.setup_widget()
+        self.update_model_value()
+
+    @property
+    def id(self):
+        return self.model.id
+
+    @property
+    def stream_count(self):
+        return self.model.stream_count
 
     @property
     def node_height(self):
@@ -110,6 +169,7 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         if self.stream_class:
             self.extra_header = 30
             self.widget = self.stream_class(parent=None)
+            self.connect_widget()
 
         # BASIC SHAPE
         self.reconstruct_shape()
@@ -122,6 +182,15 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         class_text.setFont(node_class_font)
         class_text.setPos(8, 6)
 
+        # NODE ID
+        self.id_text.setText('ID: {}'.format(self.id))
+        node_id_font = QtGui.QFont('arial', 8)
+        self.id_text.setFont(node_id_font)
+
+    def create_proxies(self):
+        # Widgets embedded in the scene are expensive to create and to paint, so they are only created for the nodes
+        # that have come into view (The value of the node is kept by its widget and its model meanwhile)
+
         # NODE WIDGET
         if self.stream_class:
             self.widget.setFixedSize(self.node_width - 10, HEADER_HEIGHT - 6)
@@ -140,11 +209,6 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         proxy.setWidget(help_btn)
         proxy.moveBy(self.node_width - 25, 7)
 
-        # NODE ID
-        self.id_text.setText('ID: {}'.format(self.id))
-        node_id_font = QtGui.QFont('arial', 8)
-        self.id_text.setFont(node_id_font)
-
         # ADD / DELETE STREAMS BUTTONS
         add_btn = QtWidgets.QPushButton(parent=None)
         add_btn.setFixedSize(16, 16)
@@ -152,6 +216,7 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         add_btn.setStyleSheet('color:lime')
         add_btn.setFont(QtGui.QFont('Impact', 11))
         add_btn.clicked.connect(self.add_stream)
+        self.proxy_add_btn = QtWidgets.QGraphicsProxyWidget(parent=self)
         self.proxy_add_btn.setWidget(add_btn)
 
         remove_btn = QtWidgets.QPushButton(parent=None)
@@ -160,20 +225,29 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         remove_btn.setStyleSheet('color:red')
         remove_btn.setFont(QtGui.QFont('Impact', 11))
         remove_btn.clicked.connect(self.remove_stream)
+        self.proxy_remove_btn = QtWidgets.QGraphicsProxyWidget(parent=self)
         self.proxy_remove_btn.setWidget(remove_btn)
 
+        self.proxies_created = True
+        self.place_buttons()
+
+    def place_buttons(self):
+        if self.proxies_created:
+            self.proxy_add_btn.setPos(self.node_width - 40, self.node_height - STRIPE_HEIGHT / 2 - 8)
+            self.proxy_remove_btn.setPos(self.node_width - 25, self.node_height - STRIPE_HEIGHT / 2 - 8)
+
     def reconstruct_shape(self):
         # BASIC SHAPE
         new_path = QtGui.QPainterPath()
         new_path.addRoundedRect(QtCore.QRect(0, 0, self.node_width, self.node_height), 10, 10)
         self.setPath(new_path)
+        self.flat_rect = QtCore.QRectF(0, 0, self.node_width, self.node_height)
 
         # ID MOVEMENT
         self.id_text.setPos(10, self.node_height - STRIPE_HEIGHT / 2 - 8)
 
         # BUTTON MOVEMENT
-        self.proxy_add_btn.setPos(self.node_width - 40, self.node_height - STRIPE_HEIGHT / 2 - 8)
-        self.proxy_remove_btn.setPos(self.node_width - 25, self.node_height - STRIPE_HEIGHT / 2 - 8)
+        self.place_buttons()
 
         # MARQUEE
         new_path = QtGui.QPainterPath()
@@ -182,26 +256,44 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         self.marquee.setZValue(10)
 
         # FILLING
-        grad = QtGui.QLinearGradient(0, 0, 0, self.node_height)
-        grad.setColorAt(0.5, QtGui.QColor(self.r, self.g, self.b))
-        lighter_color = QtGui.QColor(self.r + 20, self.g + 20, self.b + 20)
-        grad.setColorAt(1.0, lighter_color)
-        self.setBrush(grad)
+        self.setBrush(node_brush(self.r, self.g, self.b))
+
+    # ------- LEVEL OF DETAIL ------- #
+    def set_detailed(self, detailed):
+        if detailed and not self.proxies_created:
+            self.create_proxies()
+
+        if detailed == self.detailed:
+            return
+
+        self.detailed = detailed
+        for child in self.childItems():
+            if child is not self.marquee:
+                child.setVisible(detailed)
+
+    def paint(self, painter, option, widget=None):
+        # Zoomed out, a flat rectangle (Also before the scene hides the details, see set_detailed)
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < DETAIL_MIN_ZOOM:
+            painter.fillRect(self.flat_rect, flat_brush(self.r, self.g, self.b))
+            return
+
+        QtWidgets.QGraphicsPathItem.paint(self, painter, option, widget)
 
     def add_stream(self):
         if self.stream_count == self.max_streams:
             return
 
-        if self.stream_count % 2 == 0:
-            new_stream = Stream(self.stream_count, self.node_width, 'light', self)
+        model_stream = self.model.add_stream()
+
+        if model_stream.index % 2 == 0:
+            new_stream = Stream(model_stream, self.node_width, 'light', self)
         else:
-            new_stream = Stream(self.stream_count, self.node_width, 'dark', self)
+            new_stream = Stream(model_stream, self.node_width, 'dark', self)
 
-        new_stream.moveBy(0,self.node_height - STRIPE_HEIGHT)
+        new_stream.moveBy(0, HEADER_HEIGHT + self.extra_header + model_stream.index * STRIPE_HEIGHT)
         new_stream.setParentItem(self)
         new_stream.setZValue(5)
 
-        self.stream_count += 1
         self.streams.append(new_stream)
 
         self.reconstruct_shape()
@@ -216,7 +308,7 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         self.scene().removeItem(stream_to_delete)
         del stream_to_delete
 
-        self.stream_count -= 1
+        self.model.remove_stream()
 
         self.reconstruct_shape()
 
@@ -232,7 +324,7 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         self.marquee.setZValue(10)
 
     def relabel_id(self, new_id):
-        self.id = new_id
+        self.model.set_id(new_id)
         self.id_text.setText('ID: {}'.format(self.id))
 
         if new_id > GeneralNode.id_counter:
@@ -260,51 +352,60 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
-            self.set_selected(True)
             self.scene().establish_selected_node(self)
 
         QtWidgets.QGraphicsPathItem.mousePressEvent(self, event)
 
-    def mouseMoveEvent(self, event):
-        if self.is_selected:
-            self.redraw_lines()
+    def itemChange(self, change, value):
+        if change == QtWidgets.QGraphicsItem.ItemPositionHasChanged:
+            self.model.x, self.model.y = self.x(), self.y()
 
-        QtWidgets.QGraphicsPathItem.mouseMoveEvent(self, event)
+            # The lines are redrawn by the scene, once per frame (See CustomScene.flush_lines)
+            if self.scene() is not None:
+                self.scene().lines_changed(self)
 
-    def redraw_lines(self):
-        for stream in self.streams:
-
-            if stream.input_line:
-                line = stream.input_line
+        elif change == QtWidgets.QGraphicsItem.ItemSelectedHasChanged:
+            self.set_selected(bool(value))
 
-                p1 = line.path().pointAtPercent(0)
-                p2 = stream.input_connector.center_point
-                new_path = QtGui.QPainterPath(p1)
-                c_p1 = QtCore.QPoint(((p2.x() + p1.x()) / 2) + 10, p1.y())
-                c_p2 = QtCore.QPoint(((p2.x() + p1.x()) / 2) - 10, p2.y())
-                new_path.cubicTo(c_p1, c_p2, p2)
-
-                line.setPath(new_path)
+        return QtWidgets.QGraphicsPathItem.itemChange(self, change, value)
 
+    def connection_lines(self):
+        # (line, output connector, input connector) of every connection of the node
+        lines = []
+        for stream in self.streams:
+            if stream.input_line:
+                lines.append((stream.input_line, stream.input_stream.output_connector, stream.input_connector))
             if stream.output_line:
-                line = stream.output_line
+                lines.append((stream.output_line, stream.output_connector, stream.output_stream.input_connector))
 
-                p1 = stream.output_connector.center_point
-                p2 = line.path().pointAtPercent(1)
-                new_path = QtGui.QPainterPath(p1)
-                c_p1 = QtCore.QPoint(((p2.x() + p1.x()) / 2) + 10, p1.y())
-                c_p2 = QtCore.QPoint(((p2.x() + p1.x()) / 2) - 10, p2.y())
-                new_path.cubicTo(c_p1, c_p2, p2)
+        return lines
 
-                line.setPath(new_path)
+    def redraw_lines(self):
+        for line, output_connector, input_connector in self.connection_lines():
+            line.setPath(connection_path(output_connector.center_point, input_connector.center_point))
 
     def setup_widget(self):
         pass
 
     def run_node(self):
-        pass
+        return self.model.run_node()
+
+    def connect_widget(self):
+        # Every edit of the widget is stored in the model
+        if self.stream_class == QtWidgets.QComboBox:
+            self.widget.currentTextChanged.connect(self.update_model_value)
+        elif self.stream_class == QtWidgets.QLineEdit:
+            self.widget.textChanged.connect(self.update_model_value)
+        elif self.stream_class == QtWidgets.QSpinBox:
+            self.widget.valueChanged.connect(self.update_model_value)
+
+    def update_model_value(self, *args):
+        self.model.set_value(self.read_widget_value())
 
     def get_widget_value(self):
+        return self.model.value
+
+    def read_widget_value(self):
         if self.stream_class is None:
             return None
 
@@ -328,6 +429,8 @@ class GeneralNode(QtWidgets.QGraphicsPathItem):
         elif self.stream_class == QtWidgets.QSpinBox:
             self.widget.setValue(new_value)
 
+        self.update_model_value()
+
     def __str__(self):
         return self.node_class + '_' + str(self.id)
 
@@ -350,10 +453,6 @@ class EmptyNode(GeneralNode):
     # NODE HELP (Overriden from general class)
     help_text = 'Empty node for testing purposes.'
 
-    def run_node(self):
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.NO_WRITING_INFO, 'Empty nodes do not return any result!', True]
-
 
 class StartNode(GeneralNode):
 
@@ -395,13 +494,15 @@ class OriginNode(GeneralNode):
     help_text = "Defines which Nuke's scene node to be rendered."
 
     def setup_widget(self):
-        for name in nuke_specifics.all_node_names():
-            self.widget.addItem(name)
+        # Names shared by all the Origin nodes (A single scan of the scene, see scene_names_model)
+        scene_names_model.setup_combo(self.widget)
 
-    def run_node(self):
-        origin = str(self.widget.currentText())
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.ORIGIN_INFO, origin, True]
+    def read_widget_value(self):
+        return scene_names_model.combo_name(self.widget)
+
+    def set_widget_value(self, new_value):
+        scene_names_model.set_combo_name(self.widget, new_value)
+        self.update_model_value()
 
 
 class OriginFromNameNode(GeneralNode):
@@ -425,15 +526,6 @@ class OriginFromNameNode(GeneralNode):
     def setup_widget(self):
         self.widget.setPlaceholderText('Enter node name')
 
-    def run_node(self):
-        origin_node = str(self.widget.text())
-        if not nuke_specifics.node_exists(origin_node):
-            return [self.node_superclass, self.node_class, self.id,
-                    abstract_stream.ORIGIN_INFO, 'The node of name {} does not exist'.format(origin_node), False]
-
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.ORIGIN_INFO, origin_node, True]
-
 
 class FilePathNode(GeneralNode):
 
@@ -458,19 +550,6 @@ class FilePathNode(GeneralNode):
     def setup_widget(self):
         self.widget.setPlaceholderText('Enter file path')
 
-    def run_node(self):
-        filepath = str(self.widget.text())
-
-        if not filepath:
-            return [self.node_superclass, self.node_class, self.id,
-                    abstract_stream.FILEPATH_INFO, 'No filepath was provided', False]
-        if not os.path.exists(filepath):
-            return [self.node_superclass, self.node_class, self.id,
-                    abstract_stream.FILEPATH_INFO, 'The filepath does not exist', False]
-
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.FILEPATH_INFO, filepath, True]
-
 
 class CommentNode(GeneralNode):
 
@@ -496,16 +575,6 @@ class CommentNode(GeneralNode):
         self.widget.setPlaceholderText('only_lowkey_comments')
         self.widget.cursorPositionChanged.connect(lambda: self.scene().establish_selected_node(None))
 
-    def run_node(self):
-        comment = str(self.widget.text())
-
-        if not comment:
-            return [self.node_superclass, self.node_class, self.id,
-                    abstract_stream.COMMENT_INFO, 'No comment was provided', False]
-
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.COMMENT_INFO, comment, True]
-
 
 class FrameStartNode(GeneralNode):
 
@@ -528,11 +597,6 @@ class FrameStartNode(GeneralNode):
     def setup_widget(self):
         self.widget.setMaximum(9999)
 
-    def run_node(self):
-        frame = self.widget.value()
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.FRAMEESTART_INFO, frame, True]
-
 
 class FrameEndNode(GeneralNode):
 
@@ -555,11 +619,6 @@ class FrameEndNode(GeneralNode):
     def setup_widget(self):
         self.widget.setMaximum(9999)
 
-    def run_node(self):
-        frame = self.widget.value()
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.FRAMEEND_INFO, frame, True]
-
 
 class ExtensionNode(GeneralNode):
 
@@ -582,10 +641,6 @@ class ExtensionNode(GeneralNode):
     def setup_widget(self):
         self.widget.addItems(['.exr', '.png', '.jpeg', '.tiff'])
 
-    def run_node(self):
-        ext = self.widget.currentText()
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.EXTENSION_INFO, ext, True]
 
 # ------- ADDITIONAL INFO NODES ------- #
 class VersionNode(GeneralNode):
@@ -611,10 +666,6 @@ class VersionNode(GeneralNode):
         self.widget.setMinimum(0)
         self.widget.setMaximum(100)
 
-    def run_node(self):
-        version = 'v.' + str(self.widget.value()).zfill(4)
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.VERSION_INFO, version, True]
 
 class PaddingNode(GeneralNode):
     # BASIC PROPERTIES (Overriden from general class)
@@ -637,15 +688,6 @@ class PaddingNode(GeneralNode):
         self.widget.setText('####')
         self.widget.setValidator(QtGui.QRegExpValidator(QtCore.QRegExp('#+')))
 
-    def run_node(self):
-        padding = str(self.widget.text())
-        if not padding:
-            return [self.node_superclass, self.node_class, self.id,
-                    abstract_stream.PADDING_INFO, '####', True]
-
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.PADDING_INFO, padding, True]
-
 
 # ------- CHECK NODES ------- #
 class ErrorsNode(GeneralNode):
@@ -666,16 +708,6 @@ class ErrorsNode(GeneralNode):
     # NODE HELP (Overriden from general class)
     help_text = 'Checks for common errors in all nodes (<i>node.hasError()</i>)'
 
-    def run_node(self):
-        error_nodes = nuke_specifics.all_nodes_with_errors()
-
-        if error_nodes:
-            return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                    'The following nodes contain some kind of error: ' + str(error_nodes), False]
-        
-        return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                'No nodes with errors have been found', True]
-
 
 class RegexNamingNode(GeneralNode):
 
@@ -698,16 +730,6 @@ class RegexNamingNode(GeneralNode):
     def setup_widget(self):
         self.widget.setPlaceholderText('Enter RegEx here')
 
-    def run_node(self):
-        misnamed_nodes = nuke_specifics.regex_checks(str(self.widget.text()))
-
-        if misnamed_nodes:
-            return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                    'The following nodes matched the provided Regular Expression: ' + str(misnamed_nodes), False]
-
-        return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                'All nodes are properly named', True]
-
 
 class DisconnectedReadsNode(GeneralNode):
 
@@ -727,16 +749,6 @@ class DisconnectedReadsNode(GeneralNode):
     # NODE HELP (Overriden from general class)
     help_text = 'Will check that all Read nodes in the scene have their output connected to another node.'
 
-    def run_node(self):
-        disconnected_reads = nuke_specifics.disconnected_reads()
-
-        if disconnected_reads:
-            return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                    'The following Read nodes were not connected to anything: ' + str(disconnected_reads), False]
-
-        return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                'All Read nodes have output', True]
-
 
 class ClassFilterNode(GeneralNode):
 
@@ -759,16 +771,6 @@ class ClassFilterNode(GeneralNode):
     def setup_widget(self):
         self.widget.setPlaceholderText('Enter class to filter')
 
-    def run_node(self):
-        invalid_nodes = nuke_specifics.forbidden_class_nodes(str(self.widget.text()))
-
-        if invalid_nodes:
-            return [self.node_superclass, self.node_class, self.id, abstract_stream.NO_WRITING_INFO,
-                    'The following nodes belong to the specified class: ' + str(invalid_nodes), False]
-
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.NO_WRITING_INFO, 'No nodes match the specified class', True]
-
 
 # ------- MANIPULATION NODES ------- #
 class DesaturationNode(GeneralNode):
@@ -789,10 +791,6 @@ class DesaturationNode(GeneralNode):
     # NODE HELP (Overriden from general class)
     help_text = 'Desaturates the output image, leaving it in shades of gray.'
 
-    def run_node(self):
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.NO_WRITING_INFO, 'The output result for this stream will be desaturated', True]
-
 
 class FlipNode(GeneralNode):
 
@@ -812,10 +810,6 @@ class FlipNode(GeneralNode):
     # NODE HELP (Overriden from general class)
     help_text = 'Flips the image horizontally.'
 
-    def run_node(self):
-        return [self.node_superclass, self.node_class, self.id,
-                abstract_stream.NO_WRITING_INFO, 'The output result for this stream will be flipped', True]
-
 
 # ------- ALL NODES LIST ------- #
 
@@ -830,22 +824,30 @@ ALL_NODES_LIST = [StartNode, EmptyNode,
 
                   VersionNode, PaddingNode]
 
+# Lookups by class and by nice name (i.e. when loading networks)
+NODES_BY_CLASS = dict((c.node_class, c) for c in ALL_NODES_LIST)
+NODES_BY_NICE_NAME = dict((c.node_class_nice_name, c) for c in ALL_NODES_LIST)
+
 
 # -------------------------------- STREAMS -------------------------------- #
 # ------------------------------------------------------------------------- #
 
 class Stream(QtWidgets.QGraphicsRectItem):
 
-    def __init__(self, stream_index, width, colortype, parent_node):
+    def __init__(self, model_stream, width, colortype, parent_node):
         QtWidgets.QGraphicsRectItem.__init__(self, 0, 0, width, STRIPE_HEIGHT, parent=parent_node)
 
+        # DATA MODEL OF THE STREAM (This item is only its view)
+        self.model = model_stream
+        self.model.view = self
+
         # BASIC VISUAL PROPERTIES
         self.width = width
 
         # BASIC PROPERTIES
         self.parent_node = parent_node
         self.parent_class = parent_node.node_class
-        self.index = stream_index
+        self.index = model_stream.index
 
         self.input_stream = None
         self.input_line = None
@@ -856,11 +858,8 @@ class Stream(QtWidgets.QGraphicsRectItem):
         r, g, b = parent_node.r, parent_node.g, parent_node.b
         if colortype == 'light':
             r, g, b = r + 20, g + 20, b + 20
-        grad = QtGui.QLinearGradient(0, 0, 0, STRIPE_HEIGHT)
-        grad.setColorAt(0.0, QtGui.QColor(r, g, b))
-        lighter_color = QtGui.QColor(r + 10, g + 10, b + 10)
-        grad.setColorAt(1.0, lighter_color)
-        self.setBrush(grad)
+        self.setBrush(stream_brush(r, g, b))
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
 
         # CONNECTORS
         self.input_connector = Connector('input', self, self.width) if self.parent_node.can_have_input else None
@@ -876,6 +875,8 @@ class Stream(QtWidgets.QGraphicsRectItem):
 
     def clear_connections(self):
 
+        self.model.disconnect()
+
         if self.input_stream:
             self.input_stream.output_connector.toggle_connection(restore=True)
             self.input_stream = None
@@ -892,6 +893,16 @@ class Stream(QtWidgets.QGraphicsRectItem):
 # -------------------------------- CONNECTORS -------------------------------- #
 # ---------------------------------------------------------------------------- #
 
+def connection_path(p1, p2):
+    # Curve of a connection, from the output connector (p1) to the input connector (p2)
+    new_path = QtGui.QPainterPath(p1)
+    c_p1 = QtCore.QPointF(((p2.x() + p1.x()) / 2) + 10, p1.y())
+    c_p2 = QtCore.QPointF(((p2.x() + p1.x()) / 2) - 10, p2.y())
+    new_path.cubicTo(c_p1, c_p2, p2)
+
+    return new_path
+
+
 class Connector(QtWidgets.QGraphicsPolygonItem):
 
     def __init__(self, c_type, parent, separation):
@@ -950,9 +961,11 @@ class Connector(QtWidgets.QGraphicsPolygonItem):
             if self.type == 'input':
                 self.parent_stream.input_stream = None
                 self.parent_stream.input_line = None
+                self.parent_stream.model.disconnect_input()
             elif self.type == 'output':
                 self.parent_stream.output_stream = None
                 self.parent_stream.output_line = None
+                self.parent_stream.model.disconnect_output()
 
         # Appearance
         if self.can_recieve_connection:
@@ -973,3 +986,4 @@ class Connector(QtWidgets.QGraphicsPolygonItem):
         elif self.type == 'output':
             self.parent_stream.output_stream = other_connector.parent_stream
             self.parent_stream.output_line = line
+            self.parent_stream.model.connect(other_connector.parent_stream.model)
@@ -0,0 +1,212 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: node_logic.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: What every node does when run, from its widget value alone (No Qt needed, so it also runs headless)
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import os
+
+import abstract_stream
+import nuke_specifics
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+NODE_SUPERCLASSES = {'Start': 'StreamControlNodes',
+                     'Empty': 'StreamControlNodes',
+
+                     'Origin': 'WritingNodes',
+                     'OriginFromName': 'WritingNodes',
+                     'FilePath': 'WritingNodes',
+                     'Comment': 'WritingNodes',
+                     'FrameStart': 'WritingNodes',
+                     'FrameEnd': 'WritingNodes',
+                     'Extension': 'WritingNodes',
+
+                     'Version': 'InfoNodes',
+                     'Padding': 'InfoNodes',
+
+                     'Errors': 'CheckNodes',
+                     'RegexNaming': 'CheckNodes',
+                     'DisconnectedReads': 'CheckNodes',
+                     'ClassFilter': 'CheckNodes',
+
+                     'Desaturation': 'Manipulation',
+                     'Flip': 'Manipulation'}
+
+# Classes whose streams cannot receive connections
+NO_INPUT_CLASSES = ('Start',)
+
+# Field of the write that each writing node provides
+WRITING_INFOS = {'Origin': abstract_stream.ORIGIN_INFO,
+                 'OriginFromName': abstract_stream.ORIGIN_INFO,
+                 'FilePath': abstract_stream.FILEPATH_INFO,
+                 'Comment': abstract_stream.COMMENT_INFO,
+                 'FrameStart': abstract_stream.FRAMEESTART_INFO,
+                 'FrameEnd': abstract_stream.FRAMEEND_INFO,
+                 'Extension': abstract_stream.EXTENSION_INFO}
+
+
+# -------------------------------- RESPONSES -------------------------------- #
+
+def response(node_class, node_id, writing_info, message, completion):
+    return [NODE_SUPERCLASSES[node_class], node_class, node_id, writing_info, message, completion]
+
+
+# ------- STREAM CONTROL NODES ------- #
+def run_empty(node_id, value):
+    return response('Empty', node_id, abstract_stream.NO_WRITING_INFO, 'Empty nodes do not return any result!', True)
+
+
+# ------- WRITING NODES ------- #
+def run_origin(node_id, value):
+    origin_node = str(value)
+    if not nuke_specifics.node_exists(origin_node):
+        return response('Origin', node_id, abstract_stream.ORIGIN_INFO,
+                        'The node of name {} does not exist'.format(origin_node), False)
+
+    return response('Origin', node_id, abstract_stream.ORIGIN_INFO, origin_node, True)
+
+def run_origin_from_name(node_id, value):
+    origin_node = str(value)
+    if not nuke_specifics.node_exists(origin_node):
+        return response('OriginFromName', node_id, abstract_stream.ORIGIN_INFO,
+                        'The node of name {} does not exist'.format(origin_node), False)
+
+    return response('OriginFromName', node_id, abstract_stream.ORIGIN_INFO, origin_node, True)
+
+def run_file_path(node_id, value):
+    filepath = str(value)
+
+    if not filepath:
+        return response('FilePath', node_id, abstract_stream.FILEPATH_INFO, 'No filepath was provided', False)
+    if not os.path.exists(filepath):
+        return response('FilePath', node_id, abstract_stream.FILEPATH_INFO, 'The filepath does not exist', False)
+
+    return response('FilePath', node_id, abstract_stream.FILEPATH_INFO, filepath, True)
+
+def run_comment(node_id, value):
+    comment = str(value)
+
+    if not comment:
+        return response('Comment', node_id, abstract_stream.COMMENT_INFO, 'No comment was provided', False)
+
+    return response('Comment', node_id, abstract_stream.COMMENT_INFO, comment, True)
+
+def run_frame_start(node_id, value):
+    return response('FrameStart', node_id, abstract_stream.FRAMEESTART_INFO, value, True)
+
+def run_frame_end(node_id, value):
+    return response('FrameEnd', node_id, abstract_stream.FRAMEEND_INFO, value, True)
+
+def run_extension(node_id, value):
+    return response('Extension', node_id, abstract_stream.EXTENSION_INFO, value, True)
+
+
+# ------- ADDITIONAL INFO NODES ------- #
+def run_version(node_id, value):
+    version = 'v.' + str(value).zfill(4)
+    return response('Version', node_id, abstract_stream.VERSION_INFO, version, True)
+
+def run_padding(node_id, value):
+    padding = str(value)
+    if not padding:
+        return response('Padding', node_id, abstract_stream.PADDING_INFO, '####', True)
+
+    return response('Padding', node_id, abstract_stream.PADDING_INFO, padding, True)
+
+
+# ------- CHECK NODES ------- #
+def run_errors(node_id, value):
+    error_nodes = nuke_specifics.all_nodes_with_errors()
+
+    if error_nodes:
+        return response('Errors', node_id, abstract_stream.NO_WRITING_INFO,
+                        'The following nodes contain some kind of error: ' + str(error_nodes), False)
+
+    return response('Errors', node_id, abstract_stream.NO_WRITING_INFO, 'No nodes with errors have been found', True)
+
+def run_regex_naming(node_id, value):
+    misnamed_nodes = nuke_specifics.regex_checks(str(value))
+
+    if misnamed_nodes:
+        return response('RegexNaming', node_id, abstract_stream.NO_WRITING_INFO,
+                        'The following nodes matched the provided Regular Expression: ' + str(misnamed_nodes), False)
+
+    return response('RegexNaming', node_id, abstract_stream.NO_WRITING_INFO, 'All nodes are properly named', True)
+
+def run_disconnected_reads(node_id, value):
+    disconnected_reads = nuke_specifics.disconnected_reads()
+
+    if disconnected_reads:
+        return response('DisconnectedReads', node_id, abstract_stream.NO_WRITING_INFO,
+                        'The following Read nodes were not connected to anything: ' + str(disconnected_reads), False)
+
+    return response('DisconnectedReads', node_id, abstract_stream.NO_WRITING_INFO, 'All Read nodes have output', True)
+
+def run_class_filter(node_id, value):
+    invalid_nodes = nuke_specifics.forbidden_class_nodes(str(value))
+
+    if invalid_nodes:
+        return response('ClassFilter', node_id, abstract_stream.NO_WRITING_INFO,
+                        'The following nodes belong to the specified class: ' + str(invalid_nodes), False)
+
+    return response('ClassFilter', node_id, abstract_stream.NO_WRITING_INFO, 'No nodes match the specified class', True)
+
+
+# ------- MANIPULATION NODES ------- #
+def run_desaturation(node_id, value):
+    return response('Desaturation', node_id, abstract_stream.NO_WRITING_INFO,
+                    'The output result for this stream will be desaturated', True)
+
+def run_flip(node_id, value):
+    return response('Flip', node_id, abstract_stream.NO_WRITING_INFO,
+                    'The output result for this stream will be flipped', True)
+
+
+# -------------------------------- RUNNERS -------------------------------- #
+
+RUNNERS = {'Empty': run_empty,
+
+           'Origin': run_origin,
+           'OriginFromName': run_origin_from_name,
+           'FilePath': run_file_path,
+           'Comment': run_comment,
+           'FrameStart': run_frame_start,
+           'FrameEnd': run_frame_end,
+           'Extension': run_extension,
+
+           'Version': run_version,
+           'Padding': run_padding,
+
+           'Errors': run_errors,
+           'RegexNaming': run_regex_naming,
+           'DisconnectedReads': run_disconnected_reads,
+           'ClassFilter': run_class_filter,
+
+           'Desaturation': run_desaturation,
+           'Flip': run_flip}
+
+def run_node(node_class, node_id, value):
+    runner = RUNNERS.get(node_class)
+    if runner is None:
+        return None
+
+    return runner(node_id, value)
@@ -23,21 +23,175 @@ __status__ = 'Testing'
 import re
 import nuke
 
+import tracing
+
+
+# -------------------------------- SCENE INDICES -------------------------------- #
+
+# Any scene index (snapshot or live index) answers the same queries:
+#   revision, node_exists(name), node_names(), nodes_with_errors(), nodes_of_class(class), disconnected_reads()
+
+class SceneSnapshot(object):
+
+    def __init__(self, revision):
+
+        # Revision of the scene this snapshot was taken at
+        self.revision = revision
+
+        # Indexed information (All gathered in a single pass through the scene)
+        self.ordered_names = []
+        self.names = set()
+        self.names_by_class = {}
+        self.error_names = []
+        self.disconnected_read_names = []
+
+        for node in nuke.allNodes():
+            if is_temporary_node(node):
+                continue
+
+            name = node.name()
+            node_class = node.Class()
+
+            self.ordered_names.append(name)
+            self.names.add(name)
+            self.names_by_class.setdefault(node_class, []).append(name)
+
+            if node.hasError():
+                self.error_names.append(name)
+
+            if node_class == 'Read' and not node.dependent(2):
+                self.disconnected_read_names.append(name)
+
+    def node_exists(self, node_name):
+        return node_name in self.names
+
+    def node_names(self):
+        return list(self.ordered_names)
+
+    def nodes_with_errors(self):
+        return list(self.error_names)
+
+    def nodes_of_class(self, node_class):
+        return list(self.names_by_class.get(node_class, []))
+
+    def disconnected_reads(self):
+        return list(self.disconnected_read_names)
+
+
+_SNAPSHOT = None
+_SNAPSHOT_REVISION = 0
+_LIVE_INDEX = None
+
+# Upstream states of the origins written during a run, by origin name (See upstream_state)
+_UPSTREAM_STATES = None
+
+@tracing.traced('scene')
+def build_scene_snapshot():
+    global _SNAPSHOT, _SNAPSHOT_REVISION, _UPSTREAM_STATES
+
+    _UPSTREAM_STATES = {}
+
+    # A live index is always up to date, no need to scan the scene
+    if _LIVE_INDEX is not None:
+        return _LIVE_INDEX
+
+    _SNAPSHOT_REVISION += 1
+    _SNAPSHOT = SceneSnapshot(_SNAPSHOT_REVISION)
+
+    return _SNAPSHOT
+
+def clear_scene_snapshot():
+    global _SNAPSHOT, _UPSTREAM_STATES
+    _SNAPSHOT = None
+    _UPSTREAM_STATES = None
+
+def set_live_index(live_index):
+    global _LIVE_INDEX
+    _LIVE_INDEX = live_index
+
+def scene_index():
+    if _LIVE_INDEX is not None:
+        return _LIVE_INDEX
+
+    return _SNAPSHOT
+
+def scene_revision():
+    index = scene_index()
+    return index.revision if index is not None else None
+
 
 # -------------------------------- INFO FROM SCENE -------------------------------- #
 
+# Knobs that do not affect the rendered image
+UPSTREAM_IGNORED_KNOBS = ('xpos', 'ypos', 'selected', 'note_font', 'note_font_size', 'note_font_color', 'tile_color',
+                          'gl_color', 'label')
+
 def all_node_names():
     return sorted([node.name() for node in nuke.allNodes() if node.Class() != 'Viewer'])
 
 def all_writes():
     return sorted([node.name() for node in nuke.allNodes('Write')])
 
+def upstream_state(origin_node_name):
+    # Described once per origin during a run: the writes only add nodes downstream, so its upstream tree stays the same
+    if _UPSTREAM_STATES is None:
+        return describe_upstream(origin_node_name)
+
+    if origin_node_name not in _UPSTREAM_STATES:
+        _UPSTREAM_STATES[origin_node_name] = describe_upstream(origin_node_name)
+
+    return _UPSTREAM_STATES[origin_node_name]
+
+@tracing.traced('write')
+def describe_upstream(origin_node_name):
+    # Text describing the origin node and everything upstream of it (classes, non-default knobs and inputs)
+    origin_node = nuke.toNode(origin_node_name)
+    if origin_node is None:
+        return ''
+
+    visited = {origin_node.fullName(): origin_node}
+    pending = [origin_node]
+    while pending:
+        for dependency in pending.pop().dependencies():
+            if dependency.fullName() not in visited:
+                visited[dependency.fullName()] = dependency
+                pending.append(dependency)
+
+    states = []
+    for full_name in sorted(visited):
+        node = visited[full_name]
+        knob_lines = node.writeKnobs(nuke.WRITE_NON_DEFAULT_ONLY | nuke.TO_SCRIPT | nuke.TO_VALUE).split('\n')
+        knobs = [line for line in knob_lines if line.strip() and line.split()[0] not in UPSTREAM_IGNORED_KNOBS]
+        inputs = [node.input(i).fullName() if node.input(i) else '' for i in range(node.inputs())]
+        states.append('{} {} {} {}'.format(full_name, node.Class(), inputs, sorted(knobs)))
+
+    return '\n'.join(states)
+
+def render_command():
+    # Command-line render of a script with the same Nuke executable
+    return [nuke.EXE_PATH, '-x']
+
+@tracing.traced('write')
+def save_script_copy(script_path):
+    # Saves to the given file without changing the name of the current script
+    nuke.scriptSave(script_path)
+
 # -------------------------------- CHECKS -------------------------------- #
 
+@tracing.traced('check')
 def node_exists(node_name):
+    index = scene_index()
+    if index is not None:
+        return index.node_exists(node_name)
+
     return node_name in [n.name() for n in nuke.allNodes()]
 
+@tracing.traced('check')
 def all_nodes_with_errors():
+    index = scene_index()
+    if index is not None:
+        return index.nodes_with_errors()
+
     error_nodes = []
 
     for node in nuke.allNodes():
@@ -46,17 +200,28 @@ def all_nodes_with_errors():
 
     return error_nodes
 
+@tracing.traced('check')
 def regex_checks(regex_string):
-    misnamed_nodes = []
     regex = re.compile(regex_string)
 
+    index = scene_index()
+    if index is not None:
+        return [name for name in index.node_names() if re.match(regex, name)]
+
+    misnamed_nodes = []
+
     for node in nuke.allNodes():
         if re.match(regex, node.name()):
             misnamed_nodes.append(node.name())
 
     return misnamed_nodes
 
+@tracing.traced('check')
 def disconnected_reads():
+    index = scene_index()
+    if index is not None:
+        return index.disconnected_reads()
+
     disconnected_reads = []
     for node in nuke.allNodes('Read'):
         if not node.dependent(2):
@@ -64,7 +229,12 @@ def disconnected_reads():
 
     return disconnected_reads
 
+@tracing.traced('check')
 def forbidden_class_nodes(forbidden_class):
+    index = scene_index()
+    if index is not None:
+        return index.nodes_of_class(forbidden_class)
+
     invalid_nodes = []
     for node in nuke.allNodes():
         if node.Class() == forbidden_class:
@@ -75,45 +245,195 @@ def forbidden_class_nodes(forbidden_class):
 
 # -------------------------------- WRITING -------------------------------- #
 
-def write_path(origin_node, path, start_frame, end_frame, extra_nodes):
+# Order in which the manipulations are chained after the origin node
+MANIPULATIONS_ORDER = ('Desaturation', 'Flip')
+
+# Names of the nodes created temporarily for writing, while they exist (See ManipulationPool.create_node). Reserved
+# before the nodes are created, so Nuke's onCreate callbacks already see them as temporary
+_TEMPORARY_NAMES = set()
+
+def is_temporary_node(node):
+    # Only the nodes created by a pool: user nodes are never temporary, whatever their name
+    return node.name() in _TEMPORARY_NAMES
+
+def unique_node_name(base_name):
+    # Several writes can be in flight at the same time (batch writing), so names must not collide
+    name, counter = base_name, 1
+    while nuke.toNode(name) is not None:
+        counter += 1
+        name = '{}_{}'.format(base_name, counter)
+
+    return name
+
+def build_manipulation(manipulation, input_node, pool):
+
+    if manipulation == 'Desaturation':
+        cc = pool.create_node('ColorCorrect', 'EXTRA_DESATURATION')
+        cc.setInput(0, input_node)
+        cc['saturation'].setValue(0)
+        return cc
+
+    if manipulation == 'Flip':
+        t = pool.create_node('Transform', 'EXTRA_FLIP')
+        t.setInput(0, input_node)
+        w, h = t.width()/2, t.height()/2
+        t['center'].setValue(w, 0)
+        t['center'].setValue(h, 1)
+        t['scale'].setValue(-1, 0)
+        t['scale'].setValue(1, 1)
+        return t
 
-    wr = nuke.nodes.Write(name='WRITER')
 
-    # Extra manipulations
-    extra_names = []
-    if extra_nodes:
-        for n in extra_nodes:
+class ManipulationPool(object):
 
-            if n == 'Desaturation':
-                cc = nuke.nodes.ColorCorrect(name='EXTRA_DESATURATION')
-                cc['saturation'].setValue(0)
-                extra_names.append('EXTRA_DESATURATION')
+    def __init__(self):
 
-            if n == 'Flip':
-                t = nuke.nodes.Transform(name='EXTRA_FLIP')
-                t.setInput(0, nuke.toNode(origin_node))
-                w, h = t.width()/2, t.height()/2
-                t['center'].setValue(w, 0)
-                t['center'].setValue(h, 1)
-                t['scale'].setValue(-1, 0)
-                t['scale'].setValue(1, 1)
-                extra_names.append('EXTRA_FLIP')
+        # Last node of every manipulation chain, by (origin node name, ordered manipulations)
+        self.chains = {}
 
-        first_extra_node = nuke.toNode(extra_names[0])
-        first_extra_node.setInput(0, nuke.toNode(origin_node))
+        # Every node created by the pool (Deleted all together at cleanup)
+        self.created_nodes = []
 
-        if len(extra_names) > 1:
-            for i in range(len(extra_names) - 1):
-                nuke.toNode(extra_names[i+1]).setInput(0, nuke.toNode(extra_names[i]))
+    def create_node(self, node_type, base_name):
+        name = unique_node_name(base_name)
+        _TEMPORARY_NAMES.add(name)
+        try:
+            node = getattr(nuke.nodes, node_type)(name=name)
+        except Exception:
+            _TEMPORARY_NAMES.discard(name)
+            raise
 
-        origin_node = extra_names[-1]
+        self.created_nodes.append(node)
+        return node
 
-    # Execution
+    def chain_output(self, origin_node_name, manipulations):
+        upstream = nuke.toNode(origin_node_name)
+
+        # Chains are built once and reused, also the shorter chains that are a prefix of a longer one
+        ordered_manipulations = tuple(m for m in MANIPULATIONS_ORDER if m in manipulations)
+        for i in range(len(ordered_manipulations)):
+            key = (origin_node_name, ordered_manipulations[:i+1])
+            if key not in self.chains:
+                self.chains[key] = build_manipulation(ordered_manipulations[i], upstream, self)
+            upstream = self.chains[key]
+
+        return upstream
+
+    def cleanup(self):
+        # The names are released once their nodes are gone (The onDestroy callbacks still see them as temporary)
+        for node in reversed(self.created_nodes):
+            name = node.name()
+            nuke.delete(node)
+            _TEMPORARY_NAMES.discard(name)
+
+        self.chains = {}
+        self.created_nodes = []
+
+
+_MANIPULATION_POOL = None
+
+def open_manipulation_pool():
+    global _MANIPULATION_POOL
+
+    _MANIPULATION_POOL = ManipulationPool()
+    return _MANIPULATION_POOL
+
+@tracing.traced('cleanup')
+def close_manipulation_pool():
+    global _MANIPULATION_POOL
+
+    if _MANIPULATION_POOL is not None:
+        _MANIPULATION_POOL.cleanup()
+        _MANIPULATION_POOL = None
+
+def write_pool():
+    # Outside of a run (no open pool) every write gets a pool of its own, cleaned up as soon as it is written
+    return _MANIPULATION_POOL if _MANIPULATION_POOL is not None else ManipulationPool()
+
+@tracing.traced('cleanup')
+def release_write_pool(pool):
+    if pool is not _MANIPULATION_POOL:
+        pool.cleanup()
+
+@tracing.traced('write')
+def build_write(origin_node, path, extra_nodes, pool):
+
+    wr = pool.create_node('Write', 'WRITER')
     wr['file'].setValue(path)
-    wr.setInput(0, nuke.toNode(origin_node))
-    nuke.execute(wr, start_frame, end_frame)
+    wr.setInput(0, pool.chain_output(origin_node, extra_nodes))
+
+    return wr
+
+def frame_slices(frame_ranges, slice_size):
+    # (first, last) of every slice of at most slice_size frames of the ranges
+    for range_start, range_end in frame_ranges:
+        for first_frame in range(range_start, range_end + 1, slice_size):
+            yield first_frame, min(first_frame + slice_size - 1, range_end)
+
+def frame_segments(ranges_by_write):
+    # Frames of several writes, split wherever the writes rendering them change: (first, last, indices of the writes)
+    bounds = sorted(set(bound for frame_ranges in ranges_by_write for range_start, range_end in frame_ranges
+                        for bound in (range_start, range_end + 1)))
+
+    segments = []
+    for first_frame, next_bound in zip(bounds[:-1], bounds[1:]):
+        indices = [i for i, frame_ranges in enumerate(ranges_by_write)
+                   if any(range_start <= first_frame <= range_end for range_start, range_end in frame_ranges)]
+        if indices:
+            segments.append((first_frame, next_bound - 1, indices))
+
+    return segments
+
+def write_path(origin_node, path, start_frame, end_frame, extra_nodes, frame_ranges=None, on_frames=None,
+               frame_slice=None):
+
+    pool = write_pool()
+
+    # Execution (Only the given sub-ranges, if any. In slices of frames if someone follows the progress). The pool is
+    # cleaned up even if the write could not be built
+    try:
+        wr = build_write(origin_node, path, extra_nodes, pool)
+
+        frame_ranges = frame_ranges or [(start_frame, end_frame)]
+        if on_frames is None:
+            for range_start, range_end in frame_ranges:
+                with tracing.span('execute', 'write', write=wr.name(), frames=[range_start, range_end]):
+                    nuke.execute(wr, range_start, range_end)
+        else:
+            for first_frame, last_frame in frame_slices(frame_ranges, frame_slice or 1):
+                with tracing.span('execute', 'write', write=wr.name(), frames=[first_frame, last_frame]):
+                    nuke.execute(wr, first_frame, last_frame)
+                on_frames(first_frame, last_frame)
+
+    # Cleanup
+    finally:
+        release_write_pool(pool)
+
+def write_paths(write_specs, on_frames=None, frame_slice=None):
+    # write_specs: list of (origin_node, path, extra_nodes, frame_ranges)
+
+    pool = write_pool()
+
+    # Execution (All the writes that render a frame at once, so the upstream tree shared by them is only computed once
+    # per frame. In slices of frames if someone follows the progress, still all those writes at once in each)
+    try:
+        writes = [build_write(origin_node, path, extra_nodes, pool)
+                  for origin_node, path, extra_nodes, _ in write_specs]
+
+        for segment_start, segment_end, indices in frame_segments([spec[3] for spec in write_specs]):
+            segment_writes = [writes[i] for i in indices]
+            if on_frames is None:
+                with tracing.span('executeMultiple', 'write', writes=len(segment_writes),
+                                  frames=[segment_start, segment_end]):
+                    nuke.executeMultiple(segment_writes, [(segment_start, segment_end, 1)])
+                continue
+
+            for first_frame, last_frame in frame_slices([(segment_start, segment_end)], frame_slice or 1):
+                with tracing.span('executeMultiple', 'write', writes=len(segment_writes),
+                                  frames=[first_frame, last_frame]):
+                    nuke.executeMultiple(segment_writes, [(first_frame, last_frame, 1)])
+                on_frames(first_frame, last_frame)
 
     # Cleanup
-    nuke.delete(wr)
-    for name in extra_names:
-        nuke.delete(nuke.toNode(name))
\ No newline at end of file
+    finally:
+        release_write_pool(pool)
@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: render_manifest.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Manifest of the outputs rendered to a directory, used to skip the streams that have not changed
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import hashlib
+import json
+import os
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+MANIFEST_FILE_NAME = 'scene_checks_manifest.json'
+MANIFEST_VERSION = 1
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def stream_hash(upstream_state, manipulation_nodes, start_frame, end_frame, path):
+    content = json.dumps([upstream_state, sorted(manipulation_nodes), start_frame, end_frame, path])
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+# -------------------------------- CLASS -------------------------------- #
+
+class RenderManifest(object):
+
+    def __init__(self, directory):
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE_NAME)
+        self.outputs = {}
+
+        self.load()
+
+    def load(self):
+        if not os.path.isfile(self.manifest_path):
+            return
+
+        try:
+            with open(self.manifest_path, 'r') as r:
+                manifest_dict = json.load(r)
+        except ValueError:
+            # Unreadable manifest, everything will be rendered again
+            return
+
+        if manifest_dict.get('version') == MANIFEST_VERSION:
+            self.outputs = manifest_dict.get('outputs', {})
+
+    def save(self):
+        with open(self.manifest_path, 'w') as w:
+            json.dump({'version': MANIFEST_VERSION, 'outputs': self.outputs}, w, indent=2, sort_keys=True)
+
+    def is_current(self, path, output_hash):
+        entry = self.outputs.get(path)
+        return entry is not None and entry['hash'] == output_hash
+
+    def record(self, path, output_hash, origin_node_name, manipulation_nodes, start_frame, end_frame):
+        self.outputs[path] = {'hash': output_hash,
+                              'origin': origin_node_name,
+                              'manipulations': sorted(manipulation_nodes),
+                              'start_frame': start_frame,
+                              'end_frame': end_frame}
+        self.save()
+
+    def forget(self, path):
+        # Output written with no hash (The previous entry does not describe the files anymore)
+        if self.outputs.pop(path, None) is not None:
+            self.save()
@@ -0,0 +1,152 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: render_pool.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Renders the queued writes in frame chunks, through a pool of command-line Nuke processes
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import multiprocessing
+import os
+import subprocess
+import tempfile
+import time
+
+import nuke_specifics
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+DEFAULT_CHUNK_SIZE = 10
+POLL_INTERVAL = 0.1
+
+
+# -------------------------------- FUNCTIONS -------------------------------- #
+
+def split_frame_range(start_frame, end_frame, chunk_size):
+    chunks = []
+    chunk_start = start_frame
+    while chunk_start <= end_frame:
+        chunk_end = min(chunk_start + chunk_size - 1, end_frame)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + 1
+
+    return chunks
+
+
+# -------------------------------- CLASSES -------------------------------- #
+
+class RenderChunk(object):
+
+    def __init__(self, job, write_name, start_frame, end_frame):
+
+        # Write job the chunk belongs to
+        self.job = job
+        self.write_name = write_name
+
+        # Frames
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+
+        # Execution
+        self.process = None
+        self.returncode = None
+
+    @property
+    def succeeded(self):
+        return self.returncode == 0
+
+
+class ProcessPoolRenderer(object):
+
+    # The render command and the launcher can be replaced (i.e. by a stub command when testing).
+    # The launcher gets the full argument list and must return a Popen-like object (poll, kill, returncode)
+
+    def __init__(self, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, render_command=None, launcher=subprocess.Popen):
+
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.render_command = render_command
+        self.launcher = launcher
+
+    def command(self, script_path, chunk):
+        render_command = self.render_command or nuke_specifics.render_command()
+        return list(render_command) + ['-X', chunk.write_name,
+                                       '-F', '{}-{}'.format(chunk.start_frame, chunk.end_frame), script_path]
+
+    def build_chunks(self, jobs, write_names):
+        chunks = []
+        for job, write_name in zip(jobs, write_names):
+            for range_start, range_end in job.frame_ranges:
+                for start_frame, end_frame in split_frame_range(range_start, range_end, self.chunk_size):
+                    chunks.append(RenderChunk(job, write_name, start_frame, end_frame))
+
+        return chunks
+
+    def iter_run_chunks(self, script_path, chunks, progress=None):
+        pending = list(reversed(chunks))
+        running = []
+
+        try:
+            while pending or running:
+
+                # Fill the pool
+                while pending and len(running) < self.workers:
+                    chunk = pending.pop()
+                    chunk.process = self.launcher(self.command(script_path, chunk))
+                    running.append(chunk)
+
+                # Collect finished chunks
+                finished = [chunk for chunk in running if chunk.process.poll() is not None]
+                for chunk in finished:
+                    chunk.returncode = chunk.process.returncode
+                    running.remove(chunk)
+                    yield chunk
+
+                if not finished:
+                    if progress is not None:
+                        progress.waiting()
+                        progress.check_cancelled()
+                    time.sleep(POLL_INTERVAL)
+        finally:
+            # Stopped before the end, no process is left behind
+            for chunk in running:
+                if chunk.process.poll() is None:
+                    chunk.process.kill()
+
+    def iter_render(self, jobs, progress=None):
+        pool = nuke_specifics.write_pool()
+
+        # The command-line processes render from a copy of the current script
+        file_descriptor, script_path = tempfile.mkstemp(prefix='scene_checks_', suffix='.nk')
+        os.close(file_descriptor)
+
+        try:
+            writes = [nuke_specifics.build_write(job.origin_node_name, job.path, job.manipulation_nodes, pool)
+                      for job in jobs]
+            nuke_specifics.save_script_copy(script_path)
+            chunks = self.build_chunks(jobs, [wr.name() for wr in writes])
+            running_chunks = self.iter_run_chunks(script_path, chunks, progress)
+            try:
+                for chunk in running_chunks:
+                    yield chunk
+            finally:
+                running_chunks.close()
+        finally:
+            nuke_specifics.release_write_pool(pool)
+            os.remove(script_path)
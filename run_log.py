@@ -0,0 +1,173 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: run_log.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Structured log of a run. Every message is a LogRecord, handed to any number of sinks (Feedback window, JSONL
+       file, memory...). No Qt needed here, the Qt sink is in log_view.py
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import collections
+import datetime
+import json
+import re
+import sys
+import time
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+# LEVELS
+INFO = 'info'
+STREAM = 'stream'
+WRITE = 'write'
+WARNING = 'warning'
+ERROR = 'error'
+
+LEVELS = (INFO, STREAM, WRITE, WARNING, ERROR)
+
+LEVEL_COLORS = {INFO: 'white',
+                STREAM: 'lime',
+                WRITE: 'magenta',
+                WARNING: 'orange',
+                ERROR: 'red'}
+
+LEVEL_SIZES = {INFO: 4,
+               STREAM: 5,
+               WRITE: 4,
+               WARNING: 4,
+               ERROR: 4}
+
+TAGS_REGEX = re.compile('<[^>]*>')
+
+
+# -------------------------------- RECORDS -------------------------------- #
+
+class LogRecord(collections.namedtuple('LogRecord', ['timestamp', 'level', 'stream', 'node_class', 'node_id',
+                                                     'message'])):
+
+    # The message may contain some HTML formatting (Only for the feedback window, see text)
+
+    __slots__ = ()
+
+    @property
+    def formatted_time(self):
+        return datetime.datetime.fromtimestamp(self.timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+    @property
+    def text(self):
+        return TAGS_REGEX.sub('', self.message.replace('<br>', ' | ')).strip(' |')
+
+    def to_html(self):
+        return "<font color='{0}' size={1}>[{2}] {3}</font>".format(LEVEL_COLORS[self.level], LEVEL_SIZES[self.level],
+                                                                    self.formatted_time, self.message)
+
+    def to_text(self):
+        return '[{}] {}'.format(self.formatted_time, self.text)
+
+    def to_dict(self):
+        return {'timestamp': self.timestamp,
+                'level': self.level,
+                'stream': self.stream,
+                'node_class': self.node_class,
+                'node_id': self.node_id,
+                'message': self.text}
+
+
+# -------------------------------- SINKS -------------------------------- #
+
+class LogSink(object):
+
+    # Receives every record of a run (Sinks may buffer them until flush). The base sink drops them
+
+    def emit(self, record):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class MemorySink(LogSink):
+
+    def __init__(self, max_records=None):
+        self.records = collections.deque(maxlen=max_records)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    @property
+    def lines(self):
+        return [record.to_text() for record in self.records]
+
+
+class PrintSink(LogSink):
+
+    def __init__(self, output=None):
+        self.output = output or sys.stdout
+
+    def emit(self, record):
+        self.output.write(record.to_text() + '\n')
+
+
+class JsonlSink(LogSink):
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w')
+
+    def emit(self, record):
+        self.file.write(json.dumps(record.to_dict()) + '\n')
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# -------------------------------- LOG -------------------------------- #
+
+class RunLog(object):
+
+    def __init__(self, sinks=()):
+        self.sinks = list(sinks)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink):
+        self.sinks.remove(sink)
+
+    def log(self, message, level=INFO, stream='', node_class=None, node_id=None):
+        record = LogRecord(time.time(), level, stream, node_class, node_id, message)
+        for sink in self.sinks:
+            sink.emit(record)
+
+        return record
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
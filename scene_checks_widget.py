@@ -23,11 +23,16 @@ __status__ = 'Testing'
 from PySide2 import QtWidgets
 from PySide2 import QtGui
 from PySide2 import QtCore
+import multiprocessing
 import os
+import tempfile
 
-import node_classes
 import custom_widgets
-import abstract_stream
+import execution_controller
+import log_view
+import node_classes
+import run_log
+import scene_names_model
 
 
 class SceneChecks(QtWidgets.QWidget):
@@ -47,9 +52,26 @@ class SceneChecks(QtWidgets.QWidget):
         self.setWindowTitle('Scene checks / write')
 
         # FEEDBACK
-        self.the_process_window = QtWidgets.QTextEdit()
-        self.the_process_window.setReadOnly(True)
-        self.the_process_window.setWindowTitle('Stream execution feedback')
+        self.feedback_widget = QtWidgets.QWidget()
+        self.feedback_widget.setWindowTitle('Stream execution feedback')
+        self.feedback_layout = QtWidgets.QGridLayout(self.feedback_widget)
+
+        self.log_panel = log_view.LogPanel()
+        self.feedback_layout.addWidget(self.log_panel, 0, 0, 1, 2)
+
+        self.run_log = run_log.RunLog([self.log_panel.sink])
+
+        self.progress_label = QtWidgets.QLabel()
+        self.feedback_layout.addWidget(self.progress_label, 1, 0, 1, 2)
+
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.feedback_layout.addWidget(self.progress_bar, 2, 0, 1, 1)
+
+        self.cancel_btn = QtWidgets.QPushButton('Cancel')
+        self.cancel_btn.setEnabled(False)
+        self.feedback_layout.addWidget(self.cancel_btn, 2, 1, 1, 1)
+
+        self.controller = execution_controller.ExecutionController(self.run_log, self)
 
         # LAYOUT
         self.grid = QtWidgets.QGridLayout(self)
@@ -78,6 +100,41 @@ class SceneChecks(QtWidgets.QWidget):
         self.gs.setParent(self.gw)
         self.grid.addWidget(self.gw, 0, 1, 3, 3)
 
+        self.write_options_layout = QtWidgets.QHBoxLayout()
+        self.grid.addLayout(self.write_options_layout, 3, 1, 1, 1)
+
+        self.write_mode_combo = QtWidgets.QComboBox()
+        self.write_mode_combo.addItems(['Write each stream when ready', 'Batch write all streams at the end',
+                                        'Render in parallel processes'])
+        self.write_mode_combo.setFixedHeight(35)
+        self.write_options_layout.addWidget(self.write_mode_combo)
+
+        self.workers_spinbox = QtWidgets.QSpinBox()
+        self.workers_spinbox.setPrefix('Workers: ')
+        self.workers_spinbox.setRange(1, 256)
+        self.workers_spinbox.setValue(multiprocessing.cpu_count())
+        self.workers_spinbox.setFixedHeight(35)
+        self.write_options_layout.addWidget(self.workers_spinbox)
+
+        self.resume_checkbox = QtWidgets.QCheckBox('Resume')
+        self.resume_checkbox.setToolTip('Only render the frames that are missing (or empty) on disk')
+        self.write_options_layout.addWidget(self.resume_checkbox)
+
+        self.skip_unchanged_checkbox = QtWidgets.QCheckBox('Skip unchanged')
+        self.skip_unchanged_checkbox.setToolTip('Do not render again the streams whose origin, manipulations, frames '
+                                                'and output have not changed since their last render')
+        self.write_options_layout.addWidget(self.skip_unchanged_checkbox)
+
+        self.full_audit_checkbox = QtWidgets.QCheckBox('Full audit')
+        self.full_audit_checkbox.setToolTip('Run every check node, even in the streams that can not be rendered or '
+                                            'whose other checks have already failed')
+        self.write_options_layout.addWidget(self.full_audit_checkbox)
+
+        self.trace_checkbox = QtWidgets.QCheckBox('Trace timings')
+        self.trace_checkbox.setToolTip('Measure the time spent on every stream, node, check and write, and save it as '
+                                       'a Chrome trace')
+        self.write_options_layout.addWidget(self.trace_checkbox)
+
         self.visualize_streams_btn = QtWidgets.QPushButton('Visualize Streams')
         self.visualize_streams_btn.setFixedHeight(50)
         self.grid.addWidget(self.visualize_streams_btn, 3, 2, 1, 1)
@@ -86,11 +143,22 @@ class SceneChecks(QtWidgets.QWidget):
         self.run_btn.setFixedHeight(50)
         self.grid.addWidget(self.run_btn, 3, 3, 1, 1)
 
+        # Disabled while a run is going on (See running_changed)
+        self.run_locked_widgets = [self.nodes_tree, self.save_network_btn, self.load_network_btn, self.gw,
+                                   self.write_mode_combo, self.workers_spinbox, self.resume_checkbox,
+                                   self.skip_unchanged_checkbox, self.full_audit_checkbox, self.trace_checkbox,
+                                   self.visualize_streams_btn, self.run_btn]
+
         # CONNECTIONS
         self.save_network_btn.clicked.connect(self.save_network)
         self.load_network_btn.clicked.connect(self.load_network)
         self.visualize_streams_btn.clicked.connect(self.visualize_all_streams)
         self.run_btn.clicked.connect(self.run_all_streams)
+        self.cancel_btn.clicked.connect(self.controller.cancel)
+        self.controller.running_changed.connect(self.running_changed)
+        self.controller.stream_progress.connect(self.stream_progress)
+        self.controller.node_progress.connect(self.node_progress)
+        self.controller.frame_progress.connect(self.frame_progress)
 
         # INITIALIZE
         self.populate_tree()
@@ -127,11 +195,56 @@ class SceneChecks(QtWidgets.QWidget):
         self.gs.color_streams()
 
     def run_all_streams(self):
-        self.the_process_window.clear()
-        self.the_process_window.resize(950,700)
-        self.the_process_window.show()
-
-        for node in self.gs.all_nodes:
-            if node.node_class == 'Start':
-                for stream in node.streams:
-                    abstract_stream.AbstactStream(stream, self.the_process_window)
\ No newline at end of file
+        self.log_panel.sink.clear()
+        self.feedback_widget.resize(950,700)
+        self.feedback_widget.show()
+
+        # Runs on the data model of the scene, no graphic item is touched
+        self.controller.run(self.gs.model, self.write_mode_combo.currentIndex(), self.workers_spinbox.value(),
+                            self.resume_checkbox.isChecked(), self.skip_unchanged_checkbox.isChecked(),
+                            self.full_audit_checkbox.isChecked(), self.trace_file())
+
+    def closeEvent(self, event):
+        # The Origin combos stop following the scene, and the scene index is unsubscribed (If the checks do not use it)
+        scene_names_model.release()
+        QtWidgets.QWidget.closeEvent(self, event)
+
+    def trace_file(self):
+        if not self.trace_checkbox.isChecked():
+            return None
+
+        return os.path.join(tempfile.gettempdir(), 'scene_checks_trace.json').replace('\\', '/')
+
+    # ------- PROGRESS ------- #
+    def running_changed(self, running):
+        # The network cannot be edited, saved, loaded, nor run again while it is being run (Nor its run options changed)
+        for widget in self.run_locked_widgets:
+            widget.setEnabled(not running)
+        self.cancel_btn.setEnabled(running)
+
+        if running:
+            self.progress_bar.setRange(0, 0)
+            self.progress_label.setText('Starting run...')
+        else:
+            self.progress_bar.setRange(0, 1)
+            self.progress_bar.setValue(1)
+            if self.controller.cancelled:
+                self.progress_label.setText('Run cancelled')
+            elif self.controller.failed_renders:
+                self.progress_label.setText('Run finished, {} streams failed to render'
+                                            ''.format(self.controller.failed_renders))
+            else:
+                self.progress_label.setText('Run finished')
+
+    def stream_progress(self, stream_number, total_streams, description):
+        self.progress_bar.setRange(0, total_streams)
+        self.progress_bar.setValue(stream_number - 1)
+        self.progress_label.setText('Running {}'.format(description))
+
+    def node_progress(self, description, node_class, node_id):
+        self.progress_label.setText('{} | Executed node of type: {} (Node ID: {})'.format(description, node_class,
+                                                                                        node_id))
+
+    def frame_progress(self, description, first_frame, last_frame):
+        frames = str(first_frame) if first_frame == last_frame else '{}-{}'.format(first_frame, last_frame)
+        self.progress_label.setText('{} | Written frames {}'.format(description, frames))
@@ -0,0 +1,278 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: scene_index.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Optional resident index of the Nuke scene, kept up to date through Nuke's node callbacks
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import nuke
+
+import nuke_specifics
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+# Knobs that change all the time while working and never affect the checks
+IGNORED_KNOBS = ('xpos', 'ypos', 'selected', 'showPanel', 'hidePanel')
+
+
+# -------------------------------- CLASS -------------------------------- #
+
+class LiveSceneIndex(object):
+
+    # The dispatcher is any object with the callback API of the nuke module (nuke itself by default):
+    #   allNodes, thisNode, thisKnob, addOnCreate/removeOnCreate, addOnDestroy/removeOnDestroy,
+    #   addKnobChanged/removeKnobChanged
+
+    def __init__(self, dispatcher=nuke):
+
+        self.dispatcher = dispatcher
+        self.subscribed = False
+
+        # Bumped on every change, so results memoized for an older revision are never reused
+        self.revision = 0
+
+        # Indices
+        self.nodes_by_name = {}
+        self.class_by_name = {}
+        self.names_by_class = {}
+
+        # Errors and connections are not indexed, they are looked up on every query: no callback is fired when the pipes
+        # of the DAG are edited (Or for setInput), nor when a node gets an error
+        self.read_names = set()
+
+        # Told about every added, removed or renamed node (See add_listener)
+        self.listeners = []
+
+    # ------- BUILDING ------- #
+    def build(self):
+        self.nodes_by_name = {}
+        self.class_by_name = {}
+        self.names_by_class = {}
+        self.read_names = set()
+
+        for node in self.dispatcher.allNodes():
+            if self.is_tracked(node):
+                self.index_node(node)
+
+        self.changed()
+
+    def subscribe(self):
+        if self.subscribed:
+            return
+
+        self.dispatcher.addOnCreate(self.on_create, nodeClass='*')
+        self.dispatcher.addOnDestroy(self.on_destroy, nodeClass='*')
+        self.dispatcher.addKnobChanged(self.on_knob_changed, nodeClass='*')
+        self.subscribed = True
+
+    def unsubscribe(self):
+        if not self.subscribed:
+            return
+
+        self.dispatcher.removeOnCreate(self.on_create, nodeClass='*')
+        self.dispatcher.removeOnDestroy(self.on_destroy, nodeClass='*')
+        self.dispatcher.removeKnobChanged(self.on_knob_changed, nodeClass='*')
+        self.subscribed = False
+
+    def add_listener(self, listener):
+        # Any object with node_added(name), node_removed(name) and node_renamed(old_name, new_name)
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    # ------- INCREMENTAL UPDATES ------- #
+    def changed(self):
+        self.revision += 1
+
+    def add_node(self, node):
+        self.index_node(node)
+        for listener in self.listeners:
+            listener.node_added(node.name())
+
+    def remove_node(self, name):
+        if name not in self.nodes_by_name:
+            return
+
+        self.unindex_node(name)
+        for listener in self.listeners:
+            listener.node_removed(name)
+
+    def index_node(self, node):
+        name = node.name()
+        node_class = node.Class()
+
+        self.nodes_by_name[name] = node
+        self.class_by_name[name] = node_class
+        self.names_by_class.setdefault(node_class, set()).add(name)
+
+        if node_class == 'Read':
+            self.read_names.add(name)
+
+    def unindex_node(self, name):
+        node_class = self.class_by_name.pop(name)
+        del self.nodes_by_name[name]
+
+        class_names = self.names_by_class.get(node_class)
+        if class_names is not None:
+            class_names.discard(name)
+            if not class_names:
+                del self.names_by_class[node_class]
+
+        self.read_names.discard(name)
+
+    def rename_node(self, node):
+        new_name = node.name()
+        if new_name in self.nodes_by_name:
+            return
+
+        # Only renames pay for a search, the callback does not tell the previous name
+        old_name = None
+        for name, indexed_node in self.nodes_by_name.items():
+            if indexed_node == node:
+                old_name = name
+                break
+
+        if old_name is None:
+            self.add_node(node)
+            return
+
+        self.move_nodes([(old_name, node)])
+
+    def move_nodes(self, renamed):
+        # All the old names are dropped first, as two nodes may have swapped their names
+        for old_name, node in renamed:
+            self.unindex_node(old_name)
+
+        for old_name, node in renamed:
+            self.index_node(node)
+            for listener in self.listeners:
+                listener.node_renamed(old_name, node.name())
+
+    def sync_names(self):
+        # Renames made from Python (setName) do not always fire the knob callback, they are found when queried
+        renamed = [(name, node) for name, node in self.nodes_by_name.items() if node.name() != name]
+        if renamed:
+            self.move_nodes(renamed)
+            self.changed()
+
+    # ------- CALLBACKS ------- #
+    def is_tracked(self, node):
+        # Same scope as nuke.allNodes(): only nodes at the root of the script, and never the temporary write nodes
+        return '.' not in node.fullName() and not nuke_specifics.is_temporary_node(node)
+
+    def on_create(self):
+        node = self.dispatcher.thisNode()
+        if not self.is_tracked(node):
+            return
+
+        self.add_node(node)
+        self.changed()
+
+    def on_destroy(self):
+        node = self.dispatcher.thisNode()
+        if not self.is_tracked(node):
+            return
+
+        self.remove_node(node.name())
+        self.changed()
+
+    def on_knob_changed(self):
+        knob = self.dispatcher.thisKnob()
+        if knob is None or knob.name() in IGNORED_KNOBS:
+            return
+
+        node = self.dispatcher.thisNode()
+        if not self.is_tracked(node):
+            return
+
+        if knob.name() == 'name':
+            self.rename_node(node)
+
+        self.changed()
+
+    # ------- QUERIES ------- #
+    def node_exists(self, node_name):
+        self.sync_names()
+        return node_name in self.nodes_by_name
+
+    def node_names(self):
+        self.sync_names()
+        return list(self.nodes_by_name)
+
+    def nodes_with_errors(self):
+        self.sync_names()
+        return sorted(name for name, node in self.nodes_by_name.items() if node.hasError())
+
+    def nodes_of_class(self, node_class):
+        self.sync_names()
+        return sorted(self.names_by_class.get(node_class, []))
+
+    def disconnected_reads(self):
+        self.sync_names()
+        return sorted(name for name in self.read_names if not self.nodes_by_name[name].dependent(2))
+
+
+# -------------------------------- RESIDENT INDEX -------------------------------- #
+
+# Kept up to date while the checks use it (enable) or while something listens to it (i.e. the Origin names, see
+# scene_names_model)
+
+_INDEX = None
+_ENABLED = False
+
+def resident_index(dispatcher=nuke):
+    global _INDEX
+
+    if _INDEX is None:
+        _INDEX = LiveSceneIndex(dispatcher)
+        _INDEX.build()
+        _INDEX.subscribe()
+
+    return _INDEX
+
+def release_resident_index():
+    # Only once nothing uses it anymore
+    global _INDEX
+
+    if _INDEX is not None and not _ENABLED and not _INDEX.listeners:
+        _INDEX.unsubscribe()
+        _INDEX = None
+
+def enable(dispatcher=nuke):
+    global _ENABLED
+
+    index = resident_index(dispatcher)
+    nuke_specifics.set_live_index(index)
+    _ENABLED = True
+
+    return index
+
+def disable():
+    global _ENABLED
+
+    if _ENABLED:
+        nuke_specifics.set_live_index(None)
+        _ENABLED = False
+        release_resident_index()
+
+def live_index():
+    return _INDEX if _ENABLED else None
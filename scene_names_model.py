@@ -0,0 +1,218 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: scene_names_model.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Sorted list of the names of the Nuke scene nodes, shared by all the Origin combos. Filled once, and kept up to
+       date by the resident scene index (See scene_index)
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+from PySide2 import QtWidgets
+from PySide2 import QtGui
+from PySide2 import QtCore
+import bisect
+
+import scene_index
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+COMBO_MIN_CONTENTS_LENGTH = 12
+
+MISSING_COLOR = 'gray'
+
+# Classes never offered as origin (As in nuke_specifics.all_node_names)
+UNLISTED_CLASSES = ('Viewer',)
+
+
+# -------------------------------- MODEL -------------------------------- #
+
+class SceneNodeNamesModel(QtCore.QAbstractListModel):
+
+    # Listens to a scene_index.LiveSceneIndex. The names of removed nodes stay in the list, marked as missing, so the
+    # combos showing them keep their value (Origin nodes with a missing name fail when the stream runs)
+
+    def __init__(self, index, parent=None):
+        QtCore.QAbstractListModel.__init__(self, parent)
+
+        self.index_source = index
+
+        self.names = []
+        self.missing = set()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        name = self.names[index.row()]
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return name
+        if name in self.missing:
+            if role == QtCore.Qt.ForegroundRole:
+                return QtGui.QBrush(QtGui.QColor(MISSING_COLOR))
+            if role == QtCore.Qt.ToolTipRole:
+                return 'The node {} is not in the scene anymore'.format(name)
+
+        return None
+
+    def row_of(self, name):
+        row = bisect.bisect_left(self.names, name)
+        return row if row < len(self.names) and self.names[row] == name else -1
+
+    # ------- BUILDING ------- #
+    def populate(self):
+        self.beginResetModel()
+        self.names = sorted(name for name in self.index_source.node_names() if self.is_listed(name))
+        self.missing = set()
+        self.endResetModel()
+
+    def is_listed(self, name):
+        return self.index_source.class_by_name.get(name) not in UNLISTED_CLASSES
+
+    # ------- INCREMENTAL UPDATES ------- #
+    def ensure_name(self, name):
+        # Row of the name, added as missing if the scene has no such node (i.e. names of loaded networks). No row for
+        # an empty name
+        if not name:
+            return -1
+
+        row = self.row_of(name)
+        if row >= 0:
+            return row
+
+        self.missing.add(name)
+        return self.insert_name(name)
+
+    def insert_name(self, name):
+        row = bisect.bisect_left(self.names, name)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.names.insert(row, name)
+        self.endInsertRows()
+
+        return row
+
+    def set_missing(self, name, missing):
+        row = self.row_of(name)
+        if row < 0 or (name in self.missing) == missing:
+            return
+
+        if missing:
+            self.missing.add(name)
+        else:
+            self.missing.discard(name)
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    # ------- INDEX LISTENER ------- #
+    def node_added(self, name):
+        if not self.is_listed(name):
+            return
+
+        if self.row_of(name) >= 0:
+            self.set_missing(name, False)
+        else:
+            self.insert_name(name)
+
+    def node_removed(self, name):
+        self.set_missing(name, True)
+
+    def node_renamed(self, old_name, new_name):
+        old_row = self.row_of(old_name)
+        if old_row < 0 or self.row_of(new_name) >= 0:
+            self.set_missing(old_name, True)
+            self.node_added(new_name)
+            return
+
+        # The row is moved, not removed and inserted again, so the combos showing it follow the new name
+        destination = bisect.bisect_left(self.names, new_name)
+        if destination in (old_row, old_row + 1):
+            new_row = old_row
+            self.names[old_row] = new_name
+        else:
+            new_row = destination if destination < old_row else destination - 1
+            self.beginMoveRows(QtCore.QModelIndex(), old_row, old_row, QtCore.QModelIndex(), destination)
+            self.names.pop(old_row)
+            self.names.insert(new_row, new_name)
+            self.endMoveRows()
+
+        self.missing.discard(old_name)
+        self.dataChanged.emit(self.index(new_row), self.index(new_row))
+
+
+# -------------------------------- SHARED MODEL -------------------------------- #
+
+_MODEL = None
+
+def shared_model():
+    global _MODEL
+
+    if _MODEL is None:
+        index = scene_index.resident_index()
+        _MODEL = SceneNodeNamesModel(index)
+        _MODEL.populate()
+        index.add_listener(_MODEL)
+
+    return _MODEL
+
+def release():
+    global _MODEL
+
+    if _MODEL is not None:
+        _MODEL.index_source.remove_listener(_MODEL)
+        scene_index.release_resident_index()
+        _MODEL = None
+
+
+# -------------------------------- COMBOS -------------------------------- #
+
+def setup_combo(combo, model=None):
+    # The combo shows the shared model (No copy of the names), and can be searched by typing any part of a name
+    model = model or shared_model()
+
+    combo.setModel(model)
+    combo.setEditable(True)
+    combo.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
+
+    # Sized without measuring every name
+    combo.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(COMBO_MIN_CONTENTS_LENGTH)
+    combo.view().setUniformItemSizes(True)
+
+    completer = QtWidgets.QCompleter(model, combo)
+    completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+    completer.setFilterMode(QtCore.Qt.MatchContains)
+    completer.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+    combo.setCompleter(completer)
+
+    combo.lineEdit().editingFinished.connect(lambda: commit_combo_text(combo))
+
+def commit_combo_text(combo):
+    # Only names of the list are chosen: any other text typed is replaced by the current name
+    row = combo.model().row_of(combo.currentText())
+    if row >= 0:
+        combo.setCurrentIndex(row)
+    else:
+        combo.setEditText(combo.itemText(combo.currentIndex()))
+
+def set_combo_name(combo, name):
+    combo.setCurrentIndex(combo.model().ensure_name(name))
+
+def combo_name(combo):
+    # The chosen name, not the text being typed
+    return str(combo.itemText(combo.currentIndex()))
@@ -0,0 +1,44 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: conftest.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: The modules import each other by their plain names (As Nuke loads them), and only the headless ones are tested,
+       with the in-memory fake_nuke as the nuke module
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+sys.path.insert(0, TESTS_DIR)
+
+import fake_nuke
+sys.modules['nuke'] = fake_nuke
+
+
+@pytest.fixture
+def scene():
+    # Empty scene for every test, and no scene index left over from another one
+    import nuke_specifics
+
+    nuke_specifics.set_live_index(None)
+    nuke_specifics.clear_scene_snapshot()
+    return fake_nuke.reset()
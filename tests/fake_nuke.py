@@ -0,0 +1,207 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: fake_nuke.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Small in-memory stand-in of the nuke module, for the tests and benchmarks run outside of Nuke. It also works as
+       the callback dispatcher of scene_index.LiveSceneIndex (Callbacks are only fired when the tests say so)
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+EXE_PATH = '/usr/local/bin/nuke'
+
+WRITE_NON_DEFAULT_ONLY = 1
+TO_SCRIPT = 2
+TO_VALUE = 4
+
+
+# -------------------------------- NODES -------------------------------- #
+
+class Knob(object):
+
+    def __init__(self, name, value=None):
+        self._name = name
+        self._values = {0: value}
+
+    def name(self):
+        return self._name
+
+    def value(self, index=0):
+        return self._values.get(index)
+
+    def setValue(self, value, index=0):
+        self._values[index] = value
+
+
+class Node(object):
+
+    def __init__(self, name, node_class, error=False, inputs=1):
+        self._name = name
+        self._class = node_class
+        self.error = error
+        self.inputs_list = [None] * inputs
+        self.knobs = {'name': Knob('name', name)}
+
+    def name(self):
+        return self._name
+
+    def fullName(self):
+        return self._name
+
+    def Class(self):
+        return self._class
+
+    def hasError(self):
+        return self.error
+
+    def setName(self, name):
+        self._name = name
+        self.knobs['name'].setValue(name)
+
+    def setInput(self, index, node):
+        self.inputs_list[index] = node
+
+    def input(self, index):
+        return self.inputs_list[index]
+
+    def inputs(self):
+        return len(self.inputs_list)
+
+    def dependencies(self):
+        return [node for node in self.inputs_list if node is not None]
+
+    def dependent(self, what=0):
+        return [node for node in SCENE.nodes if self in node.inputs_list]
+
+    def writeKnobs(self, flags):
+        return '\n'.join('{} {}'.format(name, knob.value()) for name, knob in sorted(self.knobs.items())
+                         if name != 'name')
+
+    def width(self):
+        return 1920
+
+    def height(self):
+        return 1080
+
+    def __getitem__(self, knob_name):
+        return self.knobs.setdefault(knob_name, Knob(knob_name))
+
+
+# -------------------------------- SCENE -------------------------------- #
+
+class Scene(object):
+
+    def __init__(self):
+        self.nodes = []
+        self.executed = []
+        self.callbacks = {'create': [], 'destroy': [], 'knob': []}
+        self.this_node = None
+        self.this_knob = None
+
+    def fire(self, kind, node, knob=None):
+        self.this_node, self.this_knob = node, knob
+        try:
+            for callback in list(self.callbacks[kind]):
+                callback()
+        finally:
+            self.this_node, self.this_knob = None, None
+
+
+SCENE = Scene()
+
+def reset():
+    global SCENE
+    SCENE = Scene()
+    return SCENE
+
+def create_node(name, node_class='NoOp', error=False, fire=True):
+    node = Node(name, node_class, error)
+    SCENE.nodes.append(node)
+    if fire:
+        SCENE.fire('create', node)
+
+    return node
+
+
+class _NodeConstructors(object):
+
+    # nuke.nodes.Write(name='...') and the like
+    def __getattr__(self, node_class):
+        def constructor(name=None, **knobs):
+            node = create_node(name or node_class + '1', node_class)
+            for knob_name, value in knobs.items():
+                node[knob_name].setValue(value)
+            return node
+
+        return constructor
+
+
+nodes = _NodeConstructors()
+
+
+# -------------------------------- API -------------------------------- #
+
+def allNodes(node_class=None):
+    return [node for node in SCENE.nodes if node_class is None or node.Class() == node_class]
+
+def toNode(name):
+    for node in SCENE.nodes:
+        if node.name() == name:
+            return node
+
+    return None
+
+def delete(node):
+    SCENE.fire('destroy', node)
+    SCENE.nodes.remove(node)
+
+def execute(write, start, end):
+    SCENE.executed.append(([write.name()], [(start, end, 1)]))
+
+def executeMultiple(writes, ranges):
+    SCENE.executed.append(([write.name() for write in writes], list(ranges)))
+
+def scriptOpen(path):
+    pass
+
+def scriptSave(path):
+    with open(path, 'w') as w:
+        w.write('# fake script\n')
+
+def thisNode():
+    return SCENE.this_node
+
+def thisKnob():
+    return SCENE.this_knob
+
+def addOnCreate(callback, nodeClass='*'):
+    SCENE.callbacks['create'].append(callback)
+
+def removeOnCreate(callback, nodeClass='*'):
+    SCENE.callbacks['create'].remove(callback)
+
+def addOnDestroy(callback, nodeClass='*'):
+    SCENE.callbacks['destroy'].append(callback)
+
+def removeOnDestroy(callback, nodeClass='*'):
+    SCENE.callbacks['destroy'].remove(callback)
+
+def addKnobChanged(callback, nodeClass='*'):
+    SCENE.callbacks['knob'].append(callback)
+
+def removeKnobChanged(callback, nodeClass='*'):
+    SCENE.callbacks['knob'].remove(callback)
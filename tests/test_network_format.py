@@ -0,0 +1,98 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: test_network_format.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Round trips of saved networks, in every format, with and without connections
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import json
+
+import pytest
+
+import graph_model
+import network_format
+
+
+FILE_NAMES = ['network.json', 'network.jsonl', 'network.jsonl.gz']
+
+
+def build_graph(connected=True, node_count=6):
+    graph = graph_model.GraphModel()
+    builder = graph.builder()
+    keys = [builder.add_node('Start', stream_count=2, x=-10, y=5)]
+    keys += [builder.add_node('Comment', value='comment_{}'.format(i), x=i * 200, y=0) for i in range(node_count - 1)]
+    empty = builder.add_node('Empty', stream_count=2)
+    if connected:
+        builder.chain(keys)
+        builder.connect(keys[0], empty, origin_index=1, target_index=1)
+    builder.build()
+
+    return graph
+
+def graph_state(graph):
+    nodes = sorted((n.node_class, n.id, n.x, n.y, n.value, n.stream_count) for n in graph.nodes)
+    connections = sorted((c.output_stream.parent_class, c.output_stream.parent_id, c.output_stream.index,
+                          c.input_stream.parent_class, c.input_stream.parent_id, c.input_stream.index)
+                         for c in graph.connections())
+    return nodes, connections
+
+
+@pytest.mark.parametrize('file_name', FILE_NAMES)
+@pytest.mark.parametrize('graph', [build_graph(), build_graph(connected=False), graph_model.GraphModel()],
+                         ids=['with_edges', 'without_edges', 'empty'])
+def test_round_trip(tmpdir, file_name, graph):
+    path = str(tmpdir.join(file_name))
+    network_format.write_network(graph, path)
+
+    loaded = network_format.load_graph(path)
+
+    assert graph_state(loaded) == graph_state(graph)
+
+@pytest.mark.parametrize('file_name', FILE_NAMES)
+def test_reader_closes_the_file(tmpdir, file_name):
+    path = str(tmpdir.join(file_name))
+    network_format.write_network(build_graph(connected=False), path)
+
+    reader = network_format.NetworkReader(path)
+    node_records = list(reader.node_records())
+    connection_records = list(reader.connection_records())
+    reader.close()
+
+    assert len(node_records) == 7
+    assert connection_records == []
+    assert reader.file.closed
+
+def test_chunks_of_big_networks(tmpdir):
+    graph = build_graph(node_count=network_format.CHUNK_SIZE * 2 + 5)
+    path = str(tmpdir.join('network.jsonl'))
+    network_format.write_network(graph, path)
+
+    with open(path) as r:
+        lines = [json.loads(line) for line in r]
+
+    assert lines[0]['node_count'] == len(graph.nodes)
+    assert sum(1 for line in lines if 'nodes' in line) == 3
+    assert graph_state(network_format.load_graph(path)) == graph_state(graph)
+
+def test_newer_versions_are_rejected(tmpdir):
+    path = str(tmpdir.join('network.jsonl'))
+    with open(path, 'w') as w:
+        w.write(json.dumps({'format': network_format.FORMAT_NAME, 'version': network_format.FORMAT_VERSION + 1}))
+
+    with pytest.raises(ValueError):
+        network_format.NetworkReader(path)
@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: test_render_cache.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Render cache and resume of the streams: which frames are written, and which hash is recorded afterwards
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import collections
+import os
+
+import pytest
+
+import abstract_stream
+import fake_nuke
+import nuke_specifics
+import render_manifest
+import run_log
+
+
+StreamPlan = collections.namedtuple('StreamPlan', ['description', 'operations'])
+
+START_FRAME = 1
+END_FRAME = 10
+
+
+@pytest.fixture
+def writes(scene, monkeypatch):
+    # Frame ranges of every write (None for the whole range), the frame files are created as if rendered
+    calls = []
+
+    def write_path(origin_node, path, start_frame, end_frame, extra_nodes, frame_ranges=None, on_frames=None,
+                   frame_slice=None):
+        calls.append(frame_ranges)
+        for first, last in frame_ranges or [(start_frame, end_frame)]:
+            for frame in range(first, last + 1):
+                with open(path.replace('#####', str(frame).zfill(5)), 'w') as w:
+                    w.write('frame')
+
+    monkeypatch.setattr(nuke_specifics, 'write_path', write_path)
+    fake_nuke.create_node('Read1', 'Read')
+    return calls
+
+def make_stream(directory, resume=False, skip_unchanged=False):
+    stream = abstract_stream.AbstactStream(StreamPlan('Test stream', []), run_log.RunLog(), resume=resume,
+                                           skip_unchanged=skip_unchanged)
+    stream.origin_node_name = 'Read1'
+    stream.file_path = directory
+    stream.comment = 'render_'
+    stream.extension = '.exr'
+    stream.start_frame = START_FRAME
+    stream.end_frame = END_FRAME
+    return stream
+
+def recorded_hash(directory, stream):
+    return render_manifest.RenderManifest(directory).outputs[stream.output_path]['hash']
+
+
+def test_unchanged_outputs_are_skipped(tmpdir, writes):
+    directory = str(tmpdir)
+    make_stream(directory, skip_unchanged=True).send_to_write()
+    make_stream(directory, skip_unchanged=True).send_to_write()
+
+    assert writes == [None]
+
+def test_resume_of_a_current_output(tmpdir, writes):
+    directory = str(tmpdir)
+    stream = make_stream(directory, skip_unchanged=True)
+    stream.send_to_write()
+    os.remove(os.path.join(directory, 'render_00004.exr'))
+
+    make_stream(directory, resume=True, skip_unchanged=True).send_to_write()
+
+    assert writes == [None, [(4, 4)]]
+
+def test_stale_outputs_are_rendered_again(tmpdir, writes):
+    directory = str(tmpdir)
+    make_stream(directory, skip_unchanged=True).send_to_write()
+    os.remove(os.path.join(directory, 'render_00004.exr'))
+
+    # The scene changes: the frames left on disk are not valid anymore, even when resuming
+    fake_nuke.toNode('Read1')['file'].setValue('/other/plate.exr')
+    stream = make_stream(directory, resume=True, skip_unchanged=True)
+    stream.send_to_write()
+
+    assert writes == [None, None]
+    assert recorded_hash(directory, stream) == stream.output_hash
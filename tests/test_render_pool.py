@@ -0,0 +1,153 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: test_render_pool.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Renders in parallel processes, with a stub Python command in place of the command-line Nuke
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import collections
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import abstract_stream
+import batch_runner
+import fake_nuke
+import graph_model
+import network_format
+import nuke_specifics
+import render_pool
+import run_log
+import write_queue
+
+
+StreamPlan = collections.namedtuple('StreamPlan', ['description', 'operations'])
+
+# Arguments of the command: -X <write name> -F <first frame>-<last frame> <script>
+FAILING_CHUNK_COMMAND = [sys.executable, '-c', 'import sys; sys.exit(3 if sys.argv[4] == "11-20" else 0)']
+ENDLESS_COMMAND = [sys.executable, '-c', 'import time; time.sleep(60)']
+
+
+class CancellingProgress(abstract_stream.RunProgress):
+
+    # Cancels the run the first time it waits for the processes
+    def waiting(self):
+        self.cancelled = True
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise abstract_stream.RunCancelled()
+
+
+@pytest.fixture
+def launched(scene, monkeypatch):
+    # Every process started by the renderers
+    processes = []
+
+    def launcher(command):
+        processes.append(subprocess.Popen(command))
+        return processes[-1]
+
+    monkeypatch.setattr(render_pool, 'POLL_INTERVAL', 0.01)
+    fake_nuke.create_node('Read1', 'Read')
+    yield launcher, processes
+
+    for process in processes:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+def make_job(directory, log, start_frame=1, end_frame=25, frame_ranges=None):
+    stream = abstract_stream.AbstactStream(StreamPlan('Test stream', []), log)
+    stream.output_path = os.path.join(directory, 'render_#####.exr')
+    return write_queue.WriteJob(stream, 'Read1', stream.output_path, start_frame, end_frame, set(), frame_ranges)
+
+
+def test_chunks_of_ten(tmpdir):
+    renderer = render_pool.ProcessPoolRenderer(workers=2)
+    whole_range = make_job(str(tmpdir), run_log.RunLog())
+    resumed = make_job(str(tmpdir), run_log.RunLog(), frame_ranges=[(3, 4), (8, 19)])
+
+    chunks = renderer.build_chunks([whole_range, resumed], ['Write1', 'Write2'])
+
+    assert [(chunk.write_name, chunk.start_frame, chunk.end_frame) for chunk in chunks] == [
+        ('Write1', 1, 10), ('Write1', 11, 20), ('Write1', 21, 25),
+        ('Write2', 3, 4), ('Write2', 8, 17), ('Write2', 18, 19)]
+
+def test_failed_chunks_are_reported(tmpdir, launched):
+    launcher, processes = launched
+    memory_sink = run_log.MemorySink()
+    job = make_job(str(tmpdir), run_log.RunLog([memory_sink]))
+
+    queue = write_queue.WriteQueue(render_pool.ProcessPoolRenderer(2, render_command=FAILING_CHUNK_COMMAND,
+                                                                   launcher=launcher))
+    queue.add(job)
+    queue.submit()
+
+    chunk_records = sorted(record.text for record in memory_sink.records if record.text.startswith('Rendered'))
+    assert chunk_records == ['Rendered frames 1-10 of Test stream (Exit status: 0)',
+                             'Rendered frames 11-20 of Test stream (Exit status: 3)',
+                             'Rendered frames 21-25 of Test stream (Exit status: 0)']
+    assert [record.level for record in memory_sink.records if '11-20' in record.text][0] == run_log.ERROR
+
+    assert job.abstract_stream.failed_frame_ranges == [(11, 20)]
+    assert job.abstract_stream.render_failed
+    assert len(processes) == 3
+    assert not os.path.exists(os.path.join(str(tmpdir), 'scene_checks_manifest.json'))
+
+def test_cancel_kills_the_processes(tmpdir, launched):
+    launcher, processes = launched
+    job = make_job(str(tmpdir), run_log.RunLog())
+
+    queue = write_queue.WriteQueue(render_pool.ProcessPoolRenderer(2, render_command=ENDLESS_COMMAND,
+                                                                   launcher=launcher))
+    queue.add(job)
+    with pytest.raises(abstract_stream.RunCancelled):
+        queue.submit(CancellingProgress())
+
+    # Only the first two chunks were started, and no temporary node is left in the scene
+    assert len(processes) == 2
+    assert all(process.wait() != 0 for process in processes)
+    assert fake_nuke.allNodes('Write') == []
+
+def test_failed_renders_fail_headless_runs(tmpdir, launched, monkeypatch):
+    # Rendered by the default launcher
+    monkeypatch.setattr(nuke_specifics, 'render_command', lambda: FAILING_CHUNK_COMMAND)
+
+    graph = graph_model.GraphModel()
+    builder = graph.builder()
+    builder.chain([builder.add_node('Start'), builder.add_node('Origin', value='Read1'),
+                   builder.add_node('FilePath', value=str(tmpdir)), builder.add_node('Comment', value='render_'),
+                   builder.add_node('FrameStart', value=1), builder.add_node('FrameEnd', value=25),
+                   builder.add_node('Extension', value='.exr')])
+    builder.build()
+    network_path = str(tmpdir.join('network.jsonl'))
+    network_format.write_network(graph, network_path)
+
+    report_path = str(tmpdir.join('report.json'))
+    exit_code = batch_runner.main([network_path, 'script.nk', '--report', report_path, '--write-mode', 'pool'])
+
+    with open(report_path) as r:
+        report = json.load(r)
+    assert exit_code == 1
+    assert report['failed_streams'] == 1
+    assert report['streams'][0]['checks_passed']
+    assert report['streams'][0]['failed_frames'] == [[11, 20]]
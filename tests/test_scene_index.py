@@ -0,0 +1,128 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: test_scene_index.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Live scene index, with the fake nuke module as dispatcher: callbacks, listeners, and the edits that fire none
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import pytest
+
+import fake_nuke
+import nuke_specifics
+import scene_index
+
+
+class Listener(object):
+
+    def __init__(self):
+        self.events = []
+
+    def node_added(self, name):
+        self.events.append(('added', name))
+
+    def node_removed(self, name):
+        self.events.append(('removed', name))
+
+    def node_renamed(self, old_name, new_name):
+        self.events.append(('renamed', old_name, new_name))
+
+
+@pytest.fixture
+def index(scene):
+    live_index = scene_index.LiveSceneIndex(fake_nuke)
+    live_index.build()
+    live_index.subscribe()
+    yield live_index
+    live_index.unsubscribe()
+
+
+def test_created_and_destroyed_nodes(index):
+    listener = Listener()
+    index.add_listener(listener)
+
+    read = fake_nuke.create_node('Read1', 'Read')
+    fake_nuke.create_node('Grade1', 'Grade')
+    fake_nuke.delete(read)
+
+    assert index.node_names() == ['Grade1']
+    assert index.nodes_of_class('Read') == []
+    assert listener.events == [('added', 'Read1'), ('added', 'Grade1'), ('removed', 'Read1')]
+
+def test_connections_without_callbacks(index):
+    # Pipes edited in the DAG (Or with setInput) fire no callback
+    read = fake_nuke.create_node('Read1', 'Read')
+    grade = fake_nuke.create_node('Grade1', 'Grade')
+    assert index.disconnected_reads() == ['Read1']
+
+    grade.setInput(0, read)
+    assert index.disconnected_reads() == []
+
+    grade.setInput(0, None)
+    assert index.disconnected_reads() == ['Read1']
+
+def test_errors_without_callbacks(index):
+    # A node gets an error when something upstream changes, not when one of its own knobs does
+    read = fake_nuke.create_node('Read1', 'Read')
+    grade = fake_nuke.create_node('Grade1', 'Grade')
+    grade.setInput(0, read)
+    assert index.nodes_with_errors() == []
+
+    grade.error = True
+    assert index.nodes_with_errors() == ['Grade1']
+
+    grade.error = False
+    assert index.nodes_with_errors() == []
+
+def test_renames(index):
+    listener = Listener()
+    index.add_listener(listener)
+    read = fake_nuke.create_node('Read1', 'Read', fire=False)
+    index.build()
+
+    # Renamed in the properties panel
+    read.setName('Plate')
+    fake_nuke.SCENE.fire('knob', read, read['name'])
+    assert index.nodes_of_class('Read') == ['Plate']
+
+    # Renamed from Python, with no callback
+    read.setName('Plate_v2')
+    assert index.node_exists('Plate_v2')
+    assert not index.node_exists('Plate')
+    assert listener.events == [('renamed', 'Read1', 'Plate'), ('renamed', 'Plate', 'Plate_v2')]
+
+def test_swapped_names(index):
+    first = fake_nuke.create_node('A', 'Read')
+    second = fake_nuke.create_node('B', 'Grade')
+
+    first.setName('B')
+    second.setName('A')
+
+    assert index.nodes_of_class('Read') == ['B']
+    assert index.nodes_of_class('Grade') == ['A']
+
+def test_temporary_nodes_are_not_indexed(index):
+    listener = Listener()
+    index.add_listener(listener)
+
+    pool = nuke_specifics.ManipulationPool()
+    pool.create_node('Write', 'SceneChecks_Write')
+    assert index.node_names() == []
+
+    pool.cleanup()
+    assert index.node_names() == []
+    assert listener.events == []
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: test_write_queue.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Batch writing: the writes executed together on every frame, whatever their frame ranges
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+import collections
+import os
+
+import pytest
+
+import abstract_stream
+import fake_nuke
+import nuke_specifics
+import run_log
+import write_queue
+
+
+StreamPlan = collections.namedtuple('StreamPlan', ['description', 'operations'])
+
+
+class SlicedProgress(abstract_stream.RunProgress):
+
+    frame_slice = 10
+
+    def __init__(self):
+        abstract_stream.RunProgress.__init__(self)
+        self.written = []
+
+    def frames_written(self, description, first_frame, last_frame):
+        self.written.append((first_frame, last_frame))
+
+
+def make_job(directory, name, frame_ranges):
+    stream = abstract_stream.AbstactStream(StreamPlan(name, []), run_log.RunLog())
+    stream.output_path = os.path.join(directory, name, 'render_#####.exr')
+    return write_queue.WriteJob(stream, 'Read1', stream.output_path, frame_ranges[0][0], frame_ranges[-1][1], set(),
+                                frame_ranges)
+
+def executed_frames(scene):
+    # (number of writes, first frame, last frame) of every nuke.executeMultiple
+    return [(len(write_names), ranges[0][0], ranges[0][1]) for write_names, ranges in scene.executed]
+
+
+def test_frame_segments():
+    assert nuke_specifics.frame_segments([[(1, 100)], [(1, 100)]]) == [(1, 100, [0, 1])]
+    assert nuke_specifics.frame_segments([[(1, 100)], [(51, 150)]]) == [(1, 50, [0]), (51, 100, [0, 1]),
+                                                                      (101, 150, [1])]
+    assert nuke_specifics.frame_segments([[(1, 10), (21, 30)], [(1, 30)]]) == [(1, 10, [0, 1]), (11, 20, [1]),
+                                                                             (21, 30, [0, 1])]
+
+def test_different_ranges_are_batched(scene, tmpdir):
+    fake_nuke.create_node('Read1', 'Read')
+    queue = write_queue.WriteQueue()
+    queue.add(make_job(str(tmpdir), 'whole', [(1, 100)]))
+    queue.add(make_job(str(tmpdir), 'resumed', [(41, 60)]))
+
+    queue.submit()
+
+    assert executed_frames(scene) == [(1, 1, 40), (2, 41, 60), (1, 61, 100)]
+    assert fake_nuke.allNodes('Write') == []
+
+def test_batches_in_slices(scene, tmpdir):
+    fake_nuke.create_node('Read1', 'Read')
+    queue = write_queue.WriteQueue()
+    queue.add(make_job(str(tmpdir), 'first', [(1, 25)]))
+    queue.add(make_job(str(tmpdir), 'second', [(11, 25)]))
+    progress = SlicedProgress()
+
+    queue.submit(progress)
+
+    assert executed_frames(scene) == [(1, 1, 10), (2, 11, 20), (2, 21, 25)]
+    assert progress.written == [(1, 10), (11, 20), (21, 25)]
+
+def test_failed_writes_are_cleaned_up(scene, monkeypatch):
+    # The writes to a "broken" path fail half way through their building
+    def build_write(origin_node, path, extra_nodes, pool):
+        wr = pool.create_node('Write', 'WRITER')
+        if 'broken' in path:
+            raise ValueError('The write could not be built')
+        return wr
+
+    monkeypatch.setattr(nuke_specifics, 'build_write', build_write)
+    fake_nuke.create_node('Read1', 'Read')
+
+    with pytest.raises(ValueError):
+        nuke_specifics.write_path('Read1', '/renders/broken_#####.exr', 1, 10, set())
+    with pytest.raises(ValueError):
+        nuke_specifics.write_paths([('Read1', '/renders/good_#####.exr', set(), [(1, 10)]),
+                                    ('Read1', '/renders/broken_#####.exr', set(), [(1, 10)])])
+
+    assert fake_nuke.allNodes('Write') == []
+    assert scene.executed == []
@@ -0,0 +1,156 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: tracing.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Timing spans of a run (streams, nodes, checks, writes), exported as Chrome trace JSON (chrome://tracing or
+       https://ui.perfetto.dev) and summed up in a table. Off by default, and almost free while off.
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import functools
+import json
+import os
+import threading
+import time
+
+
+# -------------------------------- CONSTANTS -------------------------------- #
+
+clock = getattr(time, 'perf_counter', time.time)
+
+
+# -------------------------------- SPANS -------------------------------- #
+
+class Span(object):
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.add_event(self.name, self.category, self.start, clock() - self.start, self.args)
+        return False
+
+
+class NullSpan(object):
+
+    # Used while the tracer is off
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+# -------------------------------- TRACER -------------------------------- #
+
+class Tracer(object):
+
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.origin = clock()
+
+    def start(self):
+        self.events = []
+        self.origin = clock()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def span(self, name, category='run', **args):
+        if not self.enabled:
+            return NULL_SPAN
+
+        return Span(self, name, category, args)
+
+    def add_event(self, name, category, start, duration, args):
+        self.events.append((name, category, start - self.origin, duration, threading.current_thread().ident, args))
+
+    # ------- EXPORT ------- #
+    def chrome_trace(self):
+        process_id = os.getpid()
+        trace_events = [{'name': name, 'cat': category, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6,
+                         'pid': process_id, 'tid': thread_id, 'args': args}
+                        for name, category, start, duration, thread_id, args in self.events]
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path):
+        with open(path, 'w') as w:
+            json.dump(self.chrome_trace(), w)
+
+    def summary(self):
+        # (category, name, count, total, mean, max) for every kind of span, the most expensive first
+        totals = {}
+        for name, category, start, duration, thread_id, args in self.events:
+            count, total, maximum = totals.get((category, name), (0, 0.0, 0.0))
+            totals[(category, name)] = (count + 1, total + duration, max(maximum, duration))
+
+        rows = [(category, name, count, total, total / count, maximum)
+                for (category, name), (count, total, maximum) in totals.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def summary_table(self):
+        lines = ['{:<10} {:<45} {:>7} {:>11} {:>11} {:>11}'.format('Category', 'Name', 'Count', 'Total (ms)',
+                                                                  'Mean (ms)', 'Max (ms)')]
+        for category, name, count, total, mean, maximum in self.summary():
+            lines.append('{:<10} {:<45} {:>7} {:>11.2f} {:>11.2f} {:>11.2f}'.format(category, name[:45], count,
+                                                                                  total * 1e3, mean * 1e3,
+                                                                                  maximum * 1e3))
+
+        return '\n'.join(lines)
+
+
+# Shared by the whole session
+TRACER = Tracer()
+
+
+# -------------------------------- HELPERS -------------------------------- #
+
+def span(name, category='run', **args):
+    return TRACER.span(name, category, **args)
+
+def traced(category):
+    # Decorator: every call of the function is a span named after it
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return function(*args, **kwargs)
+
+            with Span(TRACER, function.__name__, category, {}):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,137 @@
+# -*- coding: UTF-8 -*-
+'''
+Author: Jaime Rivera
+File: write_queue.py
+Date: 2026.10.18
+Revision: 2026.10.18
+Copyright: Copyright Jaime Rivera 2019 | www.jaimervq.com
+           The program(s) herein may be used, modified and/or distributed in accordance with the terms and conditions
+           stipulated in the Creative Commons license under which the program(s) have been registered. (CC BY-SA 4.0)
+
+Brief: Queue of stream outputs, written all together once every stream has been executed
+
+'''
+
+__author__ = 'Jaime Rivera <jaime.rvq@gmail.com>'
+__copyright__ = 'Copyright 2019, Jaime Rivera'
+__credits__ = []
+__license__ = 'Creative Commons Attribution-ShareAlike 4.0 International (CC BY-SA 4.0)'
+__maintainer__ = 'Jaime Rivera'
+__email__ = 'jaime.rvq@gmail.com'
+__status__ = 'Testing'
+
+
+import nuke_specifics
+import run_log
+
+
+# -------------------------------- CLASSES -------------------------------- #
+
+class WriteJob(object):
+
+    def __init__(self, abstract_stream, origin_node_name, path, start_frame, end_frame, manipulation_nodes,
+                 frame_ranges=None):
+
+        # Stream that requested the write (Receives the feedback)
+        self.abstract_stream = abstract_stream
+
+        # Write infos
+        self.origin_node_name = origin_node_name
+        self.path = path
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.manipulation_nodes = set(manipulation_nodes)
+
+        # Frames to render (Sub-ranges of the whole range when resuming a previous render)
+        self.frame_ranges = tuple(frame_ranges or [(start_frame, end_frame)])
+
+    @property
+    def frames_description(self):
+        return ', '.join('{}-{}'.format(range_start, range_end) for range_start, range_end in self.frame_ranges)
+
+
+class WriteQueue(object):
+
+    def __init__(self, renderer=None):
+        self.jobs = []
+
+        # Alternative backend for the render (i.e. render_pool.ProcessPoolRenderer)
+        self.renderer = renderer
+
+    def add(self, job):
+        self.jobs.append(job)
+
+    def submit(self, progress=None):
+        try:
+            if self.renderer is not None:
+                self.submit_to_renderer(progress)
+            else:
+                self.submit_batches(progress)
+        finally:
+            self.jobs = []
+
+    def submit_batches(self, progress=None):
+        # All the writes together, whatever their frame ranges: every frame is executed once, for the writes that
+        # render it (See nuke_specifics.frame_segments)
+        jobs = self.jobs
+        if not jobs:
+            return
+
+        for job in jobs:
+            job.abstract_stream.append_to_log('Starting to write the output of {}, frames {} (batched with {} other '
+                                              'writes)'.format(job.abstract_stream.description,
+                                                               job.frames_description, len(jobs) - 1), run_log.WRITE)
+
+        on_frames = None
+        frame_slice = progress.frame_slice if progress is not None else None
+        if frame_slice:
+            description = ', '.join(job.abstract_stream.description for job in jobs)
+
+            def on_frames(first_frame, last_frame):
+                progress.frames_written(description, first_frame, last_frame)
+                progress.check_cancelled()
+
+        nuke_specifics.write_paths([(job.origin_node_name, job.path, job.manipulation_nodes, job.frame_ranges)
+                                    for job in jobs], on_frames, frame_slice)
+
+        for job in jobs:
+            job.abstract_stream.append_to_log('Finished writing the output of {}'
+                                              ''.format(job.abstract_stream.description), run_log.WRITE)
+            job.abstract_stream.output_written()
+
+    def submit_to_renderer(self, progress=None):
+        for job in self.jobs:
+            job.abstract_stream.append_to_log('Starting to render the output of {} (frames {}) in parallel '
+                                              'processes'.format(job.abstract_stream.description,
+                                                                 job.frames_description), run_log.WRITE)
+
+        failed_jobs = set()
+        rendered_chunks = self.renderer.iter_render(self.jobs, progress)
+        try:
+            for chunk in rendered_chunks:
+                level = run_log.WRITE if chunk.succeeded else run_log.ERROR
+                chunk.job.abstract_stream.append_to_log('Rendered frames {}-{} of {} (Exit status: {})'
+                                                        ''.format(chunk.start_frame, chunk.end_frame,
+                                                                  chunk.job.abstract_stream.description,
+                                                                  chunk.returncode), level)
+                if not chunk.succeeded:
+                    failed_jobs.add(chunk.job)
+                    chunk.job.abstract_stream.frames_failed(chunk.start_frame, chunk.end_frame)
+
+                if progress is not None:
+                    progress.frames_written(chunk.job.abstract_stream.description, chunk.start_frame, chunk.end_frame)
+                    progress.check_cancelled()
+        finally:
+            # A cancelled render stops its processes and removes its temporary nodes right away
+            rendered_chunks.close()
+
+        for job in self.jobs:
+            if job in failed_jobs:
+                failed_ranges = sorted(job.abstract_stream.failed_frame_ranges)
+                failed_frames = ', '.join('{}-{}'.format(first_frame, last_frame)
+                                          for first_frame, last_frame in failed_ranges)
+                job.abstract_stream.append_to_log('<b>[!]</b> The output of {} has not been completely rendered '
+                                                  '(Failed frames: {})'.format(job.abstract_stream.description,
+                                                                               failed_frames), run_log.ERROR)
+            else:
+                job.abstract_stream.output_written()